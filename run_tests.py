@@ -8,13 +8,14 @@ import subprocess
 import argparse
 import webbrowser
 
-def run_tests(verbose=False, html_report=False, module=None):
+def run_tests(verbose=False, html_report=False, module=None, parallel=False):
     """Run tests with optional coverage reporting.
     
     Args:
         verbose (bool): Whether to show verbose output
         html_report (bool): Whether to generate an HTML coverage report
         module (str): Specific test module to run
+        parallel (bool): Whether to distribute tests across CPU cores with pytest-xdist
     """
     # Construct the pytest command using python -m for better compatibility
     cmd = [sys.executable, "-m", "pytest"]
@@ -23,6 +24,11 @@ def run_tests(verbose=False, html_report=False, module=None):
     if verbose:
         cmd.append("-v")
     
+    # Distribute tests across workers if specified; xdist_group-marked
+    # modules stay on one worker to share their module-scoped fixtures
+    if parallel:
+        cmd.extend(["-n", "auto", "--dist=loadgroup"])
+    
     # Add coverage flags
     cmd.extend(["--cov=src"])
     
@@ -66,7 +72,8 @@ if __name__ == "__main__":
     parser.add_argument("-v", "--verbose", action="store_true", help="Show verbose output")
     parser.add_argument("--html", action="store_true", help="Generate HTML coverage report")
     parser.add_argument("--module", help="Run a specific test module")
+    parser.add_argument("--parallel", action="store_true", help="Run tests in parallel with pytest-xdist")
     
     args = parser.parse_args()
     
-    sys.exit(run_tests(verbose=args.verbose, html_report=args.html, module=args.module)) 
\ No newline at end of file
+    sys.exit(run_tests(verbose=args.verbose, html_report=args.html, module=args.module, parallel=args.parallel)) 
\ No newline at end of file
@@ -42,8 +42,9 @@ class Playlist:
     def from_spotify_playlist(cls, playlist_data: Dict[str, Any], tracks: List[Dict[str, Any]] = None) -> 'Playlist':
         """Create a Playlist instance from Spotify API playlist data."""
         image_url = None
-        if playlist_data.get('images') and len(playlist_data['images']) > 0:
-            image_url = playlist_data['images'][0].get('url')
+        images = playlist_data.get('images')
+        if images:
+            image_url = images[0].get('url')
             
         track_objects = []
         if tracks:
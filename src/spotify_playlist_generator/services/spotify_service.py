@@ -2,10 +2,13 @@
 Spotify API service for interacting with the Spotify Web API.
 """
 import os
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterator, Optional
 import spotipy
 from spotipy.oauth2 import SpotifyOAuth
 
+# Permissions requested when authenticating with Spotify
+SCOPE = "user-library-read playlist-read-private playlist-modify-private playlist-modify-public"
+
 
 class SpotifyService:
     """Service for interacting with Spotify API."""
@@ -32,13 +35,12 @@ class SpotifyService:
             bool: True if authentication was successful
         """
         try:
-            scope = "user-library-read playlist-read-private playlist-modify-private playlist-modify-public"
             self.client = spotipy.Spotify(
                 auth_manager=SpotifyOAuth(
                     client_id=client_id,
                     client_secret=client_secret,
                     redirect_uri=redirect_uri,
-                    scope=scope
+                    scope=SCOPE
                 )
             )
             # Test the connection
@@ -71,24 +73,59 @@ class SpotifyService:
             return []
         
         try:
-            results = self.client.current_user_playlists(limit=limit, offset=offset)
-            playlists = results.get('items', [])
-            
-            # Add additional details for each playlist if needed
-            for playlist in playlists:
-                # Ensure we have image info
-                if not playlist.get('images'):
-                    playlist['images'] = [{'url': None}]
-                    
-                # Ensure track count is available
-                if 'tracks' not in playlist:
-                    playlist['tracks'] = {'total': 0}
-            
-            return playlists
+            return self._fetch_user_playlists_page(limit, offset)
         except Exception as e:
             print(f"Error fetching user playlists: {str(e)}")
             return []
     
+    def _fetch_user_playlists_page(self, limit: int, offset: int) -> List[Dict[str, Any]]:
+        """Request one page of the user's playlists, letting API errors propagate."""
+        results = self.client.current_user_playlists(limit=limit, offset=offset)
+        playlists = results.get('items', [])
+        
+        # Add additional details for each playlist if needed
+        for playlist in playlists:
+            # Ensure we have image info
+            if not playlist.get('images'):
+                playlist['images'] = [{'url': None}]
+                
+            # Ensure track count is available
+            if 'tracks' not in playlist:
+                playlist['tracks'] = {'total': 0}
+        
+        return playlists
+    
+    def iter_user_playlists(self, page_size: int = 50) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Iterate over all of the user's playlists one page at a time.
+        
+        Args:
+            page_size: Number of playlists to request per page (default: 50, max: 50)
+            
+        Yields:
+            Lists of playlist dictionaries in the same format as get_user_playlists,
+            one list per page, stopping at the first empty or short page
+            
+        Raises:
+            Exception: Any error from the Spotify API while fetching a page, so a failed
+            page is not mistaken for the end of the list
+        """
+        if not self.client:
+            print("Cannot get playlists: No authenticated Spotify client")
+            return
+        
+        offset = 0
+        while True:
+            playlists = self._fetch_user_playlists_page(page_size, offset)
+            if not playlists:
+                return
+            
+            yield playlists
+            
+            if len(playlists) < page_size:
+                return
+            offset += page_size
+    
     def get_playlist_tracks(self, playlist_id: str, limit: int = 100, offset: int = 0) -> List[Dict[str, Any]]:
         """
         Get tracks from a playlist.
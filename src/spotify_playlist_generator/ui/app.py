@@ -29,6 +29,9 @@ class AppUI:
         self.selected_track = None
         self.created_tabs = set()  # Track which tabs have been created
         self.playlist_tracks_cache = {}  # Cache tracks for each playlist
+        self.rendered_playlists_key = None  # View and playlist fingerprints currently rendered
+        self.playlists_render_generation = 0  # Bumped whenever the playlist container is re-rendered
+        self.fetching_playlists = False  # Guards against overlapping playlist fetches
         self.initial_load_complete = False  # Flag to track if initial load has happened
         self.dark_mode = True  # Default to dark theme
         
@@ -206,30 +209,39 @@ class AppUI:
             with ui.tab_panel('Settings'):
                 self._setup_settings_tab()
     
-    def _fetch_playlists(self):
+    async def _fetch_playlists(self):
         """Fetch user's playlists from Spotify."""
         if not self.is_authenticated or not self.spotify_service:
             print("[DEBUG APP] Not authenticated or no spotify service, cannot fetch playlists")
             return
         
+        if self.fetching_playlists:
+            print("[DEBUG APP] Playlist fetch already in progress, ignoring request")
+            return
+        
         print("[DEBUG APP] Fetching playlists from Spotify...")
         ui.notify('Fetching your playlists...', color='info')
         
-        # Clear existing playlists
-        self.playlists = []
+        # Collect pages separately so self.playlists keeps matching the rendered cards until the fetch succeeds
+        fetched = []
+        self.fetching_playlists = True
+        self._set_refresh_enabled(False)
         
         try:
-            # Get playlists from Spotify
-            self.playlists = self.spotify_service.get_user_playlists()
-            print(f"[DEBUG APP] Retrieved {len(self.playlists)} playlists from Spotify")
-            
-            # Update UI
-            if hasattr(self, 'playlist_container'):
-                print("[DEBUG APP] Clearing and updating playlist container")
-                self.playlist_container.clear()
-                self._render_playlists()
+            if hasattr(self, 'playlist_container') and self.rendered_playlists_key is None:
+                # Nothing rendered yet, so show each page of playlists as soon as it arrives
+                await self._stream_playlists(fetched)
             else:
-                print("[DEBUG APP] No playlist container found to update")
+                # Playlists already shown, so only re-render once everything is fetched and has changed
+                async for _ in self._iter_playlists(fetched):
+                    pass
+                self.playlists = fetched
+                
+                if hasattr(self, 'playlist_container'):
+                    self._refresh_playlist_container()
+                else:
+                    print("[DEBUG APP] No playlist container found to update")
+            print(f"[DEBUG APP] Retrieved {len(self.playlists)} playlists from Spotify")
                 
             # Show success message
             if self.playlists:
@@ -240,8 +252,86 @@ class AppUI:
         except Exception as e:
             print(f"[DEBUG APP] Error fetching playlists: {str(e)}")
             ui.notify(f'Error fetching playlists: {str(e)}', color='negative')
-            import traceback
             print(f"[DEBUG APP] Error traceback: {traceback.format_exc()}")
+        finally:
+            self.fetching_playlists = False
+            self._set_refresh_enabled(True)
+    
+    def _set_refresh_enabled(self, enabled):
+        """Enable or disable the playlist Refresh button, if it has been created."""
+        if hasattr(self, 'refresh_button'):
+            self.refresh_button.set_enabled(enabled)
+    
+    async def _iter_playlists(self, fetched):
+        """Fetch the user's playlists page by page off the event loop, appending them to fetched and yielding each one."""
+        pages = self.spotify_service.iter_user_playlists()
+        while True:
+            page = await asyncio.to_thread(next, pages, None)
+            if page is None:
+                return
+            
+            print(f"[DEBUG APP] Retrieved page of {len(page)} playlists")
+            fetched.extend(page)
+            for playlist in page:
+                yield playlist
+    
+    async def _stream_playlists(self, fetched):
+        """Render playlists into the playlist container while fetching them into the given list."""
+        print(f"[DEBUG APP] Streaming playlists in {self.current_view} view")
+        self.playlist_container.clear()
+        self.playlists_render_generation += 1
+        generation = self.playlists_render_generation
+        if self.current_view == "Tiled":
+            with self.playlist_container:
+                target = ui.grid(columns=3).classes('w-full gap-4')
+            render = PlaylistComponents.render_playlist_card
+        else:
+            target = self.playlist_container
+            render = PlaylistComponents.render_playlist_list_item
+        
+        async def current_playlists():
+            # Keep fetching if the container is re-rendered mid-stream, but stop rendering into it
+            async for playlist in self._iter_playlists(fetched):
+                if generation == self.playlists_render_generation:
+                    yield playlist
+        
+        try:
+            await PlaylistComponents.render_playlists_streaming(
+                current_playlists(), target, render, on_click=self._open_playlist_detail
+            )
+        except Exception:
+            if generation == self.playlists_render_generation:
+                # Drop the partial cards so the container matches the unchanged playlists
+                self.playlist_container.clear()
+                self._render_playlists()
+            raise
+        
+        self.playlists = fetched
+        if generation != self.playlists_render_generation:
+            # Something else (e.g. a view change) re-rendered the container mid-stream, so catch it up
+            print("[DEBUG APP] Playlist container re-rendered during streaming, refreshing")
+            self._refresh_playlist_container()
+        elif self.playlists:
+            self.rendered_playlists_key = self._playlists_render_key()
+        else:
+            # Show the empty message
+            self.playlist_container.clear()
+            self._render_playlists()
+    
+    def _playlists_render_key(self):
+        """Build a key identifying the current view and the playlists it would show."""
+        render_key = PlaylistComponents.playlist_render_key
+        return (self.current_view, tuple(render_key(playlist) for playlist in self.playlists))
+    
+    def _refresh_playlist_container(self):
+        """Re-render the playlist container unless it already shows the same content."""
+        if self._playlists_render_key() == self.rendered_playlists_key:
+            print("[DEBUG APP] Playlists and view unchanged, keeping rendered playlists")
+            return
+        
+        print("[DEBUG APP] Clearing and updating playlist container")
+        self.playlist_container.clear()
+        self._render_playlists()
     
     def _render_playlists(self):
         """Render the playlists in the UI based on current view."""
@@ -250,6 +340,8 @@ class AppUI:
             return
             
         print(f"[DEBUG APP] Rendering {len(self.playlists)} playlists in {self.current_view} view")
+        self.rendered_playlists_key = self._playlists_render_key()
+        self.playlists_render_generation += 1
         with self.playlist_container:
             if not self.playlists:
                 print("[DEBUG APP] No playlists to render, showing empty message")
@@ -372,8 +464,7 @@ class AppUI:
         """Change the playlist view mode and refresh the display."""
         self.current_view = view
         if hasattr(self, 'playlist_container'):
-            self.playlist_container.clear()
-            self._render_playlists()
+            self._refresh_playlist_container()
     
     def _setup_playlists_tab(self):
         """Set up the content for the playlists tab."""
@@ -408,10 +499,11 @@ class AppUI:
                                 ).classes('min-w-[100px]')
                                 
                                 # Refresh button
-                                ui.button('Refresh', icon='refresh').classes('ml-4').on('click', self._fetch_playlists)
+                                self.refresh_button = ui.button('Refresh', icon='refresh').classes('ml-4').on('click', self._fetch_playlists)
                         
                         # Create container for playlists
                         self.playlist_container = ui.element('div').classes('w-full mt-4')
+                        self.rendered_playlists_key = None
                         
                         # Initial load of playlists - ensure we load playlists if authenticated
                         if self.is_authenticated:
@@ -560,7 +652,6 @@ class AppUI:
                     
                 error_dialog.open()
         except Exception as e:
-            import traceback
             error_details = traceback.format_exc()
             print(f"[DEBUG APP] Error testing Last.fm API: {error_details}")
             ui.notify(f'Error testing Last.fm API: {str(e)}', color='negative')
@@ -626,7 +717,6 @@ class AppUI:
             except Exception as e:
                 ui.notify(f'Error loading tracks: {str(e)}', color='negative')
                 print(f"[DEBUG APP] Error loading tracks: {str(e)}")
-                import traceback
                 print(f"[DEBUG APP] Error traceback: {traceback.format_exc()}")
                 tracks = []
         
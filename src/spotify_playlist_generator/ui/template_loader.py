@@ -7,10 +7,16 @@ from pathlib import Path
 class TemplateLoader:
     """Handles loading HTML templates for the application."""
     
-    def __init__(self):
-        """Initialize the template loader."""
+    def __init__(self, opener=open):
+        """
+        Initialize the template loader.
+        
+        Args:
+            opener (callable): Function used to open template files, defaulting to the builtin open.
+        """
         # Get the absolute path to the templates directory
         self.template_dir = Path(os.path.dirname(os.path.abspath(__file__))) / 'templates'
+        self._opener = opener
     
     def load_template(self, template_name):
         """
@@ -30,5 +36,5 @@ class TemplateLoader:
         if not template_path.exists():
             raise FileNotFoundError(f"Template file not found: {template_name}")
         
-        with open(template_path, 'r', encoding='utf-8') as file:
+        with self._opener(template_path, 'r', encoding='utf-8') as file:
             return file.read() 
\ No newline at end of file
@@ -1,7 +1,297 @@
 """
 UI components for the Spotify Playlist Generator.
 """
-from nicegui import ui
+import asyncio
+from collections import namedtuple
+from functools import partial
+from html import escape
+import traceback
+from weakref import WeakKeyDictionary
+from nicegui import context, ui
+
+PlaylistView = namedtuple(
+    'PlaylistView',
+    'name description total_tracks owner image_url playlist_id is_public '
+    'has_description is_private'
+)
+
+TrackView = namedtuple(
+    'TrackView',
+    'name artist_display album_name album_image track_url'
+)
+
+_LEFT_ALIGNED_TABS_HTML = '''
+<style>
+.q-tabs--horizontal .q-tabs__content {
+    justify-content: flex-start;
+}
+</style>
+'''
+
+_HIDDEN_TABS_HTML = '''
+<style>
+.hidden-tabs .q-tabs__content {
+    display: none !important;
+}
+.hidden-tabs {
+    min-height: 0 !important;
+}
+</style>
+'''
+
+# Style keys already injected into each client's page head
+_ADDED_STYLES = WeakKeyDictionary()
+
+# Current (callback, tracks) for each track click page event, per client
+_TRACK_CLICK_TARGETS = WeakKeyDictionary()
+
+
+_TRACK_ROW_HTML = (
+    '<div class="q-card w-full p-2 hover:bg-gray-50 cursor-pointer"{on_click}>'
+    '<div class="row no-wrap items-center w-full gap-3">'
+    '{thumbnail}'
+    '<div class="column flex-grow min-w-0">'
+    '<div class="row no-wrap w-full items-center gap-2">'
+    '<div class="font-bold truncate">{name}</div>'
+    '{play_link}'
+    '</div>'
+    '<div class="text-xs text-gray-500 truncate w-full">{subtitle}</div>'
+    '</div>'
+    '</div>'
+    '</div>'
+)
+
+_TRACK_THUMBNAIL_HTML = '<img src="{url}" class="w-8 h-8 rounded object-cover">'
+
+_TRACK_PLACEHOLDER_HTML = (
+    '<div class="w-8 h-8 bg-gray-200 flex items-center justify-center rounded">'
+    '<i class="q-icon material-icons text-gray-400 text-xs">music_note</i>'
+    '</div>'
+)
+
+_TRACK_PLAY_LINK_HTML = (
+    '<a href="{url}" target="_blank" class="no-underline ml-auto flex-shrink-0 text-green-600"'
+    ' onclick="event.stopPropagation()">'
+    '<i class="q-icon material-icons">play_arrow</i>'
+    '</a>'
+)
+
+
+# Tailwind classes for the per-playlist renderers, shared across calls
+_CARD_CLS = 'w-full h-full cursor-pointer hover:shadow-lg transition-shadow relative'
+_CARD_CHECKBOX_WRAPPER_CLS = 'absolute top-2 left-2 z-10'
+_CARD_CHECKBOX_CLS = 'bg-white bg-opacity-70 rounded'
+_CARD_NAME_CLS = 'font-bold text-lg truncate w-full'
+_CARD_DESCRIPTION_CLS = 'text-xs text-gray-500 h-8 overflow-hidden'
+_CARD_FOOTER_CLS = 'items-center justify-between w-full'
+_CARD_CLICK_AREA_CLS = 'absolute inset-0 z-0'
+_CARD_FOOTER_LABEL_CLS = 'text-xs'
+
+_LIST_CARD_CLS = 'w-full mb-2 cursor-pointer transition-colors hover:bg-gray-100'
+_LIST_ROW_CLS = 'items-center p-2 w-full'
+_LIST_DESCRIPTION_CLS = 'text-xs text-gray-500 line-clamp-1'
+_LIST_FOOTER_CLS = 'text-xs text-gray-500 mt-1 space-x-2'
+_LIST_CLICK_AREA_CLS = 'absolute inset-0 ml-10'
+_LIST_CHECKBOX_CLS = 'mr-2'
+_LIST_DETAILS_CLS = 'flex-grow'
+_LIST_TITLE_ROW_CLS = 'w-full items-center'
+_LIST_NAME_CLS = 'font-bold'
+_LIST_LOCK_ICON_CLS = 'text-gray-400 ml-1'
+_LIST_SEPARATOR_CLS = 'text-gray-300 mx-1'
+
+# Image classes, placeholder classes and placeholder icon size for each image slot
+_IMAGE_VARIANTS = {
+    'card': (
+        'w-full aspect-square object-cover',
+        'w-full aspect-square bg-gray-200 flex items-center justify-center',
+        'xl'
+    ),
+    'list': (
+        'w-12 h-12 mr-4 rounded object-cover',
+        'w-12 h-12 mr-4 bg-gray-200 flex items-center justify-center rounded',
+        'md'
+    ),
+    'track_detail': (
+        'w-32 h-32 object-cover',
+        'w-32 h-32 bg-gray-200 flex items-center justify-center',
+        'xl'
+    ),
+    'detail': (
+        'w-64 h-64 object-cover rounded-lg shadow-md',
+        'w-64 h-64 bg-gray-200 flex items-center justify-center rounded-lg shadow-md',
+        'xxl'
+    ),
+}
+
+
+def _add_style_once(key, html):
+    """
+    Add a style block to the current page head unless it was already added.
+    
+    Args:
+        key (str): Identifier of the style block.
+        html (str): The HTML to add to the page head.
+    """
+    added = _ADDED_STYLES.setdefault(context.client, set())
+    if key in added:
+        return
+    added.add(key)
+    ui.add_head_html(html)
+
+
+def _image_or_placeholder(url, variant):
+    """
+    Render an image, or a music note placeholder if there is no image URL.
+    
+    Args:
+        url (str): The image URL, if any.
+        variant (str): The image slot being rendered, a key of _IMAGE_VARIANTS.
+    """
+    image_classes, placeholder_classes, icon_size = _IMAGE_VARIANTS[variant]
+    if url:
+        ui.image(url).classes(image_classes)
+    else:
+        with ui.element('div').classes(placeholder_classes):
+            ui.icon('music_note', size=icon_size).classes('text-gray-400')
+
+
+def _dispatch_click(callback, payload, event):
+    """Forward a click event to a callback with the item that was clicked."""
+    callback(payload)
+
+
+def _track_view(track):
+    """
+    Extract the fields the track renderers need in a single pass.
+    
+    Args:
+        track (dict): The track object from Spotify API (the 'track' field of a playlist item).
+        
+    Returns:
+        TrackView: The flattened track fields.
+    """
+    track_id = track.get('id', '')
+    # The API can send null artists or album, so fall back to empty containers
+    artist_names = [
+        artist.get('name') for artist in track.get('artists') or []
+        if isinstance(artist, dict) and artist.get('name')
+    ]
+    album = track.get('album') or {}
+    
+    # Use the smallest image for the thumbnail if available
+    album_image = None
+    album_images = album.get('images')
+    if album_images:
+        album_image = album_images[2 if len(album_images) >= 3 else -1].get('url')
+    
+    # Get track external URL or build from ID
+    track_url = (track.get('external_urls') or {}).get('spotify')
+    if not track_url and track_id:
+        track_url = f"https://open.spotify.com/track/{track_id}"
+    
+    return TrackView(
+        track.get('name') or 'Unknown Track',
+        ', '.join(artist_names) if artist_names else 'Unknown Artist',
+        album.get('name') or 'Unknown Album',
+        album_image,
+        track_url
+    )
+
+
+def _track_html(index, track_data, click_event=None):
+    """
+    Build the HTML for a single row of the track list.
+    
+    Args:
+        index (int): Position of the track in the list, sent with the click event.
+        track_data (dict): The track data from Spotify API.
+        click_event (str): Name of the page event to emit when the row is clicked.
+        
+    Returns:
+        str: The row HTML, or an empty string if there is no track to render or it is malformed.
+    """
+    track = track_data.get('track') if track_data else None
+    if not track:
+        return ''
+    
+    try:
+        view = _track_view(track)
+    except Exception as e:
+        # Skip just this row so one malformed track doesn't break the whole list
+        print(f"[DEBUG UI] Error rendering track {index}: {str(e)}")
+        return ''
+    if view.album_image:
+        thumbnail = _TRACK_THUMBNAIL_HTML.format(url=escape(view.album_image))
+    else:
+        thumbnail = _TRACK_PLACEHOLDER_HTML
+    play_link = _TRACK_PLAY_LINK_HTML.format(url=escape(view.track_url)) if view.track_url else ''
+    on_click = f' onclick="emitEvent(\'{click_event}\', {index})"' if click_event else ''
+    
+    return _TRACK_ROW_HTML.format(
+        on_click=on_click,
+        thumbnail=thumbnail,
+        name=escape(view.name),
+        play_link=play_link,
+        subtitle=escape(f"{view.artist_display} • {view.album_name}")
+    )
+
+
+def _dispatch_track_click(callback, tracks, event):
+    """Forward a track list click event to a callback with the track that was clicked."""
+    index = event.args[0] if isinstance(event.args, list) else event.args
+    callback(tracks[int(index)])
+
+
+def _dispatch_registered_track_click(targets, click_event, event):
+    """Forward a track list click event to the callback and tracks most recently rendered for it."""
+    callback, tracks = targets[click_event]
+    _dispatch_track_click(callback, tracks, event)
+
+
+def _on_track_click(click_event, callback, tracks):
+    """
+    Route a track list page event to a callback, registering the page handler at most once.
+    
+    Re-rendering a playlist only swaps the callback and tracks the existing handler uses,
+    so handlers don't pile up on the page holding stale track lists.
+    
+    Args:
+        click_event (str): Name of the page event emitted by the track rows.
+        callback (function): Function to call with the clicked track.
+        tracks (list): The tracks in the order their rows were rendered.
+    """
+    targets = _TRACK_CLICK_TARGETS.setdefault(context.client, {})
+    if click_event not in targets:
+        ui.on(click_event, partial(_dispatch_registered_track_click, targets, click_event))
+    targets[click_event] = (callback, tracks)
+
+
+def _playlist_view(playlist):
+    """
+    Extract the fields the playlist renderers need in a single pass.
+    
+    Args:
+        playlist (dict): The playlist data from Spotify API.
+        
+    Returns:
+        PlaylistView: The flattened playlist fields.
+    """
+    images = playlist.get('images') or ()
+    description = playlist.get('description', '')
+    image_url = images[0].get('url') if images else None
+    is_public = playlist.get('public')
+    return PlaylistView(
+        playlist.get('name', 'Unnamed Playlist'),
+        description,
+        (playlist.get('tracks') or {}).get('total', 0),
+        (playlist.get('owner') or {}).get('display_name', 'Unknown'),
+        image_url,
+        playlist.get('id', ''),
+        is_public,
+        bool(description),
+        is_public is False
+    )
+
 
 class PlaylistComponents:
     """Helper class for rendering playlist UI components."""
@@ -15,43 +305,29 @@ class PlaylistComponents:
             playlist (dict): The playlist data to render.
             on_click (function): Function to call when card is clicked.
         """
-        # Get playlist data
-        name = playlist.get('name', 'Unnamed Playlist')
-        description = playlist.get('description', '')
-        total_tracks = playlist.get('tracks', {}).get('total', 0)
-        owner = playlist.get('owner', {}).get('display_name', 'Unknown')
-        
-        # Get the image URL (use the first image if available)
-        image_url = None
-        if playlist.get('images') and len(playlist['images']) > 0:
-            image_url = playlist['images'][0].get('url')
+        view = _playlist_view(playlist)
         
         # Create a card for the playlist
-        with ui.card().classes('w-full h-full cursor-pointer hover:shadow-lg transition-shadow relative'):
+        with ui.card().classes(_CARD_CLS):
             # Add checkbox at top left
-            with ui.element('div').classes('absolute top-2 left-2 z-10'):
-                checkbox = ui.checkbox().props('dense').classes('bg-white bg-opacity-70 rounded')
+            with ui.element('div').classes(_CARD_CHECKBOX_WRAPPER_CLS):
+                checkbox = ui.checkbox().props('dense').classes(_CARD_CHECKBOX_CLS)
                 checkbox.on('click', lambda e: e.stop_propagation(), [])
             
-            if image_url:
-                ui.image(image_url).classes('w-full aspect-square object-cover')
-            else:
-                # Placeholder for missing image
-                with ui.element('div').classes('w-full aspect-square bg-gray-200 flex items-center justify-center'):
-                    ui.icon('music_note', size='xl').classes('text-gray-400')
+            _image_or_placeholder(view.image_url, 'card')
             
             with ui.card_section():
-                ui.label(name).classes('font-bold text-lg truncate w-full')
-                if description:
-                    ui.label(description).classes('text-xs text-gray-500 h-8 overflow-hidden')
+                ui.label(view.name).classes(_CARD_NAME_CLS)
+                if view.has_description:
+                    ui.label(view.description).classes(_CARD_DESCRIPTION_CLS)
                 
-                with ui.row().classes('items-center justify-between w-full'):
-                    ui.label(f"{total_tracks} tracks").classes('text-xs')
-                    ui.label(f"By {owner}").classes('text-xs')
+                with ui.row().classes(_CARD_FOOTER_CLS):
+                    ui.label(f"{view.total_tracks} tracks").classes(_CARD_FOOTER_LABEL_CLS)
+                    ui.label(f"By {view.owner}").classes(_CARD_FOOTER_LABEL_CLS)
             
             # Add click event if provided
             if on_click:
-                ui.element('div').on('click', lambda e, p=playlist: on_click(p)).classes('absolute inset-0 z-0')
+                ui.element('div').on('click', partial(_dispatch_click, on_click, playlist)).classes(_CARD_CLICK_AREA_CLS)
     
     @staticmethod
     def render_playlist_list_item(playlist, on_click=None):
@@ -62,172 +338,67 @@ class PlaylistComponents:
             playlist (dict): The playlist data to render.
             on_click (function): Function to call when item is clicked.
         """
-        # Get playlist data
-        name = playlist.get('name', 'Unnamed Playlist')
-        description = playlist.get('description', '')
-        total_tracks = playlist.get('tracks', {}).get('total', 0)
-        owner = playlist.get('owner', {}).get('display_name', 'Unknown')
-        playlist_id = playlist.get('id', '')
-        
-        # Get the image URL (use the first image if available)
-        image_url = None
-        if playlist.get('images') and len(playlist['images']) > 0:
-            image_url = playlist['images'][0].get('url')
+        view = _playlist_view(playlist)
         
         # Create a list item with hover effect
-        with ui.card().classes('w-full mb-2 cursor-pointer transition-colors hover:bg-gray-100'):
-            with ui.row().classes('items-center p-2 w-full'):
+        with ui.card().classes(_LIST_CARD_CLS):
+            with ui.row().classes(_LIST_ROW_CLS):
                 # Add checkbox at center left with event stopPropagation
-                checkbox = ui.checkbox().props('dense').classes('mr-2')
+                checkbox = ui.checkbox().props('dense').classes(_LIST_CHECKBOX_CLS)
                 checkbox.on('click', lambda e: e.stop_propagation(), [])
                 
                 # Image thumbnail (small square)
-                if image_url:
-                    ui.image(image_url).classes('w-12 h-12 mr-4 rounded object-cover')
-                else:
-                    with ui.element('div').classes('w-12 h-12 mr-4 bg-gray-200 flex items-center justify-center rounded'):
-                        ui.icon('music_note', size='md').classes('text-gray-400')
+                _image_or_placeholder(view.image_url, 'list')
                 
                 # Playlist details
-                with ui.column().classes('flex-grow'):
-                    with ui.row().classes('w-full items-center'):
-                        ui.label(name).classes('font-bold')
-                        if playlist.get('public') is False:
-                            ui.icon('lock', size='xs').classes('text-gray-400 ml-1')
+                with ui.column().classes(_LIST_DETAILS_CLS):
+                    with ui.row().classes(_LIST_TITLE_ROW_CLS):
+                        ui.label(view.name).classes(_LIST_NAME_CLS)
+                        if view.is_private:
+                            ui.icon('lock', size='xs').classes(_LIST_LOCK_ICON_CLS)
                     
-                    if description:
-                        ui.label(description).classes('text-xs text-gray-500 line-clamp-1')
+                    if view.has_description:
+                        ui.label(view.description).classes(_LIST_DESCRIPTION_CLS)
                     
-                    with ui.row().classes('text-xs text-gray-500 mt-1 space-x-2'):
-                        ui.label(f"{total_tracks} tracks")
-                        ui.label('•').classes('text-gray-300 mx-1')
-                        ui.label(f"By {owner}")
+                    with ui.row().classes(_LIST_FOOTER_CLS):
+                        ui.label(f"{view.total_tracks} tracks")
+                        ui.label('•').classes(_LIST_SEPARATOR_CLS)
+                        ui.label(f"By {view.owner}")
             
             # Add click event if provided, but don't cover the checkbox
             if on_click:
-                content_area = ui.element('div').classes('absolute inset-0 ml-10')
-                content_area.on('click', lambda e, p=playlist: on_click(p))
+                content_area = ui.element('div').classes(_LIST_CLICK_AREA_CLS)
+                content_area.on('click', partial(_dispatch_click, on_click, playlist))
 
     @staticmethod
-    def render_track_item(track_data, on_click=None):
+    def playlist_render_key(playlist):
         """
-        Render a single track item with Spotify link.
+        Build a key from everything a playlist card or list item displays.
         
         Args:
-            track_data (dict): The track data from Spotify API.
-            on_click (function): Function to call when track is clicked.
+            playlist (dict): The playlist data from Spotify API.
+            
+        Returns:
+            tuple: Equal for two playlists exactly when they would render the same.
         """
-        print(f"[DEBUG UI] Rendering track item: {type(track_data)}")
-        
-        if not track_data:
-            print("[DEBUG UI] Track data is None or empty, skipping render")
-            return
+        return (playlist.get('snapshot_id'),) + _playlist_view(playlist)
+
+    @staticmethod
+    async def render_playlists_streaming(playlists, container, render, on_click=None):
+        """
+        Render playlists into a container as they arrive from an async iterator.
         
-        try:
-            # Extract track information
-            track = track_data.get('track', {})
-            if not track:
-                print("[DEBUG UI] No 'track' field in track_data, skipping render")
-                print(f"[DEBUG UI] Track data keys: {track_data.keys()}")
-                return
-            
-            print(f"[DEBUG UI] Track object type: {type(track)}")
-            print(f"[DEBUG UI] Track object keys: {track.keys() if isinstance(track, dict) else 'Not a dict'}")
-            
-            track_id = track.get('id', '')
-            track_name = track.get('name', 'Unknown Track')
-            print(f"[DEBUG UI] Rendering track: {track_name} (ID: {track_id})")
-            
-            # Get artist(s)
-            artists = track.get('artists', [])
-            artist_names = []
-            artist_ids = []
-            
-            print(f"[DEBUG UI] Artists data: {type(artists)}, count: {len(artists) if isinstance(artists, list) else 'Not a list'}")
-            
-            # Debug the artists array to understand structure
-            print(f"[DEBUG UI] Raw artists array: {artists if len(str(artists)) < 500 else 'Too large to print'}")
-            
-            for artist in artists:
-                if isinstance(artist, dict):
-                    artist_name = artist.get('name')
-                    artist_id = artist.get('id')
-                    
-                    if artist_id:
-                        print(f"[DEBUG UI] Found artist ID: {artist_id!r} for artist: {artist_name}")
-                    else:
-                        print(f"[DEBUG UI] No ID found for artist: {artist_name}, full artist data: {artist}")
-                        
-                    if artist_name:
-                        artist_names.append(artist_name)
-                        if artist_id:
-                            artist_ids.append(artist_id)
-                else:
-                    print(f"[DEBUG UI] Artist is not a dict: {type(artist)}")
-            
-            artist_display = ', '.join(artist_names) if artist_names else 'Unknown Artist'
-            print(f"[DEBUG UI] Artist display: {artist_display}")
-            
-            # Get album data
-            album = track.get('album', {})
-            album_name = album.get('name', 'Unknown Album')
-            print(f"[DEBUG UI] Album: {album_name}")
-            
-            # Get album image if available
-            album_image = None
-            if album.get('images') and len(album['images']) > 0:
-                album_images = album.get('images', [])
-                print(f"[DEBUG UI] Album images count: {len(album_images)}")
-                # Try to get smallest image for thumbnail
-                if len(album_images) >= 3:
-                    album_image = album_images[2].get('url')
-                elif album_images:
-                    album_image = album_images[-1].get('url')
-            
-            # Get track external URL or build from ID
-            track_url = None
-            if track.get('external_urls', {}).get('spotify'):
-                track_url = track['external_urls']['spotify']
-            elif track_id:
-                track_url = f"https://open.spotify.com/track/{track_id}"
-            
-            print(f"[DEBUG UI] Track URL: {track_url}")
-            
-            # Create a more compact track item row
-            with ui.card().classes('w-full p-2 hover:bg-gray-50 cursor-pointer relative'):
-                with ui.row().classes('items-center w-full gap-3'):
-                    # Album thumbnail (smaller)
-                    if album_image:
-                        ui.image(album_image).classes('w-8 h-8 rounded object-cover')
-                    else:
-                        with ui.element('div').classes('w-8 h-8 bg-gray-200 flex items-center justify-center rounded'):
-                            ui.icon('music_note', size='xs').classes('text-gray-400')
-                    
-                    # Track details (simplified layout)
-                    with ui.column().classes('flex-grow min-w-0'): # min-w-0 helps with text truncation
-                        with ui.row().classes('w-full items-center gap-2'):
-                            # Track name
-                            ui.label(track_name).classes('font-bold truncate')
-                            
-                            # Play button (smaller and inline)
-                            if track_url:
-                                with ui.link(target=track_url, new_tab=True).classes('no-underline ml-auto flex-shrink-0 z-10'):
-                                    play_button = ui.button(icon='play_arrow').props('flat round dense').classes('text-green-600 text-sm')
-                                    play_button.on('click', lambda e: e.stop_propagation(), [])
-                        
-                        # Artist and album on one line with truncation
-                        with ui.label(f"{artist_display} • {album_name}").classes('text-xs text-gray-500 truncate w-full'):
-                            pass
-                
-                # Add click handler for the entire card if provided
-                if on_click:
-                    ui.element('div').on('click', lambda e, t=track_data: on_click(t)).classes('absolute inset-0 z-0')
-            
-            print(f"[DEBUG UI] Successfully rendered track: {track_name}")
-        except Exception as e:
-            print(f"[DEBUG UI] Error rendering track: {str(e)}")
-            import traceback
-            print(f"[DEBUG UI] Track rendering error traceback: {traceback.format_exc()}")
+        Args:
+            playlists: Async iterator yielding playlist dicts.
+            container: The UI element to render the playlists into.
+            render (function): The renderer to use for each playlist, e.g. render_playlist_card.
+            on_click (function): Function to call when a playlist is clicked.
+        """
+        async for playlist in playlists:
+            with container:
+                render(playlist, on_click=on_click)
+            # Yield to the event loop so rendered cards reach the browser before the next page arrives
+            await asyncio.sleep(0)
 
     @staticmethod
     def render_track_detail(track_data, on_back=None, on_play=None, current_playlist=None, similar_artists=None):
@@ -302,11 +473,7 @@ class PlaylistComponents:
             # Basic track info in a clear layout
             with ui.row().classes('w-full gap-4'):
                 # Album image
-                if album_image:
-                    ui.image(album_image).classes('w-32 h-32 object-cover')
-                else:
-                    with ui.element('div').classes('w-32 h-32 bg-gray-200 flex items-center justify-center'):
-                        ui.icon('music_note', size='xl').classes('text-gray-400')
+                _image_or_placeholder(album_image, 'track_detail')
                 
                 # Track info
                 with ui.column().classes('flex-grow gap-2'):
@@ -350,7 +517,7 @@ class PlaylistComponents:
                         ui.label(f"Released: {release_date}").classes('text-body2')
             
             # Similar Artists section
-            if similar_artists and len(similar_artists) > 0:
+            if similar_artists:
                 ui.separator().classes('my-4')
                 ui.label("Similar Artists").classes('text-h6 mb-2')
                 
@@ -365,9 +532,10 @@ class PlaylistComponents:
                         with ui.card().classes('p-2 hover:bg-gray-50'):
                             # Artist image
                             artist_image = None
-                            if 'images' in artist and artist['images'] and len(artist['images']) > 0:
-                                img = artist['images'][0] if len(artist['images']) > 0 else None
-                                if img and isinstance(img, dict) and 'url' in img:
+                            artist_images = artist.get('images')
+                            if artist_images:
+                                img = artist_images[0]
+                                if isinstance(img, dict) and 'url' in img:
                                     artist_image = img.get('url')
                                     
                             if artist_image:
@@ -388,7 +556,6 @@ class PlaylistComponents:
             
         except Exception as e:
             print(f"[DEBUG UI] Error in render_track_detail: {str(e)}")
-            import traceback
             print(f"[DEBUG UI] Error traceback: {traceback.format_exc()}")
             
             # Fallback rendering
@@ -414,19 +581,10 @@ class PlaylistComponents:
         if tracks:
             print(f"[DEBUG UI] Number of tracks provided: {len(tracks)}")
         
-        # Get playlist data
-        name = playlist.get('name', 'Unnamed Playlist')
-        description = playlist.get('description', '')
-        owner = playlist.get('owner', {}).get('display_name', 'Unknown')
-        total_tracks = playlist.get('tracks', {}).get('total', 0)
-        playlist_id = playlist.get('id', '')
+        view = _playlist_view(playlist)
+        playlist_id = view.playlist_id
         
-        print(f"[DEBUG UI] Playlist info - Name: {name}, Owner: {owner}, Total tracks: {total_tracks}")
-        
-        # Get the image URL (use the first image if available)
-        image_url = None
-        if playlist.get('images') and len(playlist['images']) > 0:
-            image_url = playlist['images'][0].get('url')
+        print(f"[DEBUG UI] Playlist info - Name: {view.name}, Owner: {view.owner}, Total tracks: {view.total_tracks}")
         
         # Playlist URL for opening in Spotify
         playlist_url = f"https://open.spotify.com/playlist/{playlist_id}" if playlist_id else None
@@ -444,23 +602,19 @@ class PlaylistComponents:
             # Playlist header with image and basic info
             with ui.row().classes('w-full items-start gap-6 mb-8'):
                 # Playlist image
-                if image_url:
-                    ui.image(image_url).classes('w-64 h-64 object-cover rounded-lg shadow-md')
-                else:
-                    with ui.element('div').classes('w-64 h-64 bg-gray-200 flex items-center justify-center rounded-lg shadow-md'):
-                        ui.icon('music_note', size='xxl').classes('text-gray-400')
+                _image_or_placeholder(view.image_url, 'detail')
                 
                 # Playlist information
                 with ui.column().classes('flex-grow py-4'):
-                    ui.label(name).classes('text-h4 font-bold')
-                    if description:
-                        ui.label(description).classes('text-subtitle1 text-gray-600 mt-2')
+                    ui.label(view.name).classes('text-h4 font-bold')
+                    if view.has_description:
+                        ui.label(view.description).classes('text-subtitle1 text-gray-600 mt-2')
                     
                     with ui.row().classes('mt-4 text-gray-600'):
-                        ui.label(f"Created by: {owner}").classes('text-subtitle2')
+                        ui.label(f"Created by: {view.owner}").classes('text-subtitle2')
                     
                     with ui.row().classes('mt-2 text-gray-600'):
-                        ui.label(f"{total_tracks} tracks").classes('text-subtitle2')
+                        ui.label(f"{view.total_tracks} tracks").classes('text-subtitle2')
             
             # Tracks section
             ui.separator()
@@ -482,15 +636,14 @@ class PlaylistComponents:
                 else:
                     print(f"[DEBUG UI] Attempting to render {len(tracks)} tracks")
                     
-                    # Display tracks in a standard column, without scroll area
-                    with ui.column().classes('w-full space-y-2'):
-                        if not tracks:
-                            ui.label('No tracks available').classes('text-gray-500')
-                        else:
-                            for i, track_data in enumerate(tracks):
-                                print(f"[DEBUG UI] Rendering track #{i+1}")
-                                # Pass the on_track_click callback to each track
-                                PlaylistComponents.render_track_item(track_data, on_click=on_track_click)
+                    # Build the whole track list as one HTML block rather than one element tree per track,
+                    # and handle row clicks with a single page event instead of a handler per row
+                    event_suffix = ''.join(c for c in playlist_id if c.isalnum())
+                    click_event = f"track_click_{event_suffix}" if on_track_click else None
+                    rows = [_track_html(i, track_data, click_event) for i, track_data in enumerate(tracks)]
+                    ui.html(f'<div class="track-list column w-full gap-2">{"".join(rows)}</div>').classes('w-full')
+                    if on_track_click:
+                        _on_track_click(click_event, on_track_click, tracks)
                     
                     print("[DEBUG UI] Finished rendering tracks")
 
@@ -501,24 +654,9 @@ class CustomStyles:
     @staticmethod
     def add_left_aligned_tabs_style():
         """Add CSS style for left-aligned tabs."""
-        ui.add_head_html('''
-        <style>
-        .q-tabs--horizontal .q-tabs__content {
-            justify-content: flex-start;
-        }
-        </style>
-        ''')
+        _add_style_once('left_aligned_tabs', _LEFT_ALIGNED_TABS_HTML)
     
     @staticmethod
     def add_hidden_tabs_style():
         """Add CSS style to hide tab headers but keep tab panels functional."""
-        ui.add_head_html('''
-        <style>
-        .hidden-tabs .q-tabs__content {
-            display: none !important;
-        }
-        .hidden-tabs {
-            min-height: 0 !important;
-        }
-        </style>
-        ''') 
\ No newline at end of file
+        _add_style_once('hidden_tabs', _HIDDEN_TABS_HTML)
@@ -5,6 +5,16 @@ import re
 import os
 from typing import Dict, List, Optional, Any
 
+# Everything before the ID in a valid URI, e.g. 'spotify:track'
+_VALID_PREFIXES = frozenset('spotify:' + kind for kind in ('artist', 'album', 'track', 'playlist'))
+
+# Characters format_playlist_name removes: anything but word characters and whitespace
+_NON_WORD = re.compile(r'[^\w\s]')
+# Same set restricted to ASCII, as a str.translate table for the common all-ASCII case
+_ASCII_NON_WORD = str.maketrans('', '', ''.join(
+    ch for ch in map(chr, range(128)) if not (ch.isalnum() or ch == '_' or ch.isspace())
+))
+
 
 def format_playlist_name(name: str) -> str:
     """
@@ -17,7 +27,10 @@ def format_playlist_name(name: str) -> str:
         The formatted playlist name.
     """
     # Remove special characters
-    formatted = re.sub(r'[^\w\s]', '', name)
+    if name.isascii():
+        formatted = name.translate(_ASCII_NON_WORD)
+    else:
+        formatted = _NON_WORD.sub('', name)
     
     # Limit length to 50 characters
     if len(formatted) > 50:
@@ -36,8 +49,23 @@ def validate_spotify_uri(uri: str) -> bool:
     Returns:
         True if the URI is valid, False otherwise.
     """
-    pattern = r'^spotify:(artist|album|track|playlist):([a-zA-Z0-9]{22})$'
-    return bool(re.match(pattern, uri))
+    prefix, _, spotify_id = uri.rpartition(':')
+    return (prefix in _VALID_PREFIXES and len(spotify_id) == 22
+            and spotify_id.isascii() and spotify_id.isalnum())
+
+
+def validate_spotify_uris(uris: List[str]) -> List[bool]:
+    """
+    Validate a batch of Spotify URIs.
+    
+    Args:
+        uris: The URIs to validate.
+        
+    Returns:
+        A list with one entry per URI, True where the URI is valid.
+    """
+    validate = validate_spotify_uri
+    return [validate(uri) for uri in uris]
 
 
 def truncate_description(description: str, max_length: int = 100) -> str:
@@ -71,7 +99,13 @@ def filter_playlists_by_owner(playlists: List[Dict[str, Any]], owner_id: str) ->
     Returns:
         A list of playlists owned by the specified user.
     """
-    return [playlist for playlist in playlists if playlist.get('owner', {}).get('id') == owner_id]
+    matches = []
+    append = matches.append
+    for playlist in playlists:
+        owner = playlist.get('owner')
+        if owner is not None and owner.get('id') == owner_id:
+            append(playlist)
+    return matches
 
 
 def get_env_var(name: str, default: Optional[str] = None) -> Optional[str]:
@@ -85,4 +119,4 @@ def get_env_var(name: str, default: Optional[str] = None) -> Optional[str]:
     Returns:
         The value of the environment variable, or the default value if not set.
     """
-    return os.environ.get(name, default) 
\ No newline at end of file
+    return os.environ.get(name, default)
@@ -4,84 +4,110 @@ Pytest configuration file.
 import pytest
 import sys
 import os
-from unittest.mock import MagicMock
+from types import MappingProxyType, SimpleNamespace
 
 # Add the project root to the Python path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
-# Create a mock for nicegui modules and components
-# This needs to be done before any imports
-class MockApp:
-    def __init__(self):
-        self.get = MagicMock()
-        self.post = MagicMock()
-        self.put = MagicMock()
-        self.delete = MagicMock()
-
-# Create a comprehensive nicegui mock
-class MockUI:
-    def __init__(self):
-        self.page = MagicMock()
-        self.card = MagicMock()
-        self.card_section = MagicMock()
-        self.label = MagicMock()
-        self.button = MagicMock()
-        self.image = MagicMock()
-        self.row = MagicMock()
-        self.column = MagicMock()
-        self.icon = MagicMock()
-        self.element = MagicMock()
-        self.header = MagicMock()
-        self.notify = MagicMock()
-        self.grid = MagicMock()
-        self.tabs = MagicMock()
-        self.tab = MagicMock()
-        self.tab_panels = MagicMock()
-        self.tab_panel = MagicMock()
-        self.select = MagicMock()
-        self.add_head_html = MagicMock()
-        self.navigate = MagicMock()
-        self.navigate.reload = MagicMock()
+# Lightweight stand-ins for nicegui and fastapi
+# These need to be registered before any imports of the UI modules
+class StubElement:
+    """Minimal stand-in for NiceGUI objects.
+    
+    Any attribute access or call returns the stub itself, so chained calls such as
+    ui.card().classes(...).props(...) and `with` blocks work without the call
+    recording overhead of MagicMock.
+    """
+    
+    def __init__(self, *args, **kwargs):
+        pass
+    
+    def __getattr__(self, name):
+        return self
+    
+    def __call__(self, *args, **kwargs):
+        return self
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        return False
 
-# Setup mocks for necessary modules
-mock_ui = MockUI()
-mock_app = MockApp()
+# Setup stubs for necessary modules
+mock_ui = StubElement()
+mock_app = StubElement()
 
-# Mock nicegui modules
-sys.modules["nicegui"] = MagicMock()
+# Stub nicegui and fastapi modules
+sys.modules["nicegui"] = SimpleNamespace(ui=mock_ui, app=mock_app, context=StubElement())
 sys.modules["nicegui.ui"] = mock_ui
 sys.modules["nicegui.app"] = mock_app
-sys.modules["fastapi"] = MagicMock()
-sys.modules["fastapi.responses"] = MagicMock()
-sys.modules["fastapi.responses"].HTMLResponse = MagicMock()
-sys.modules["fastapi.responses"].PlainTextResponse = MagicMock()
+sys.modules["fastapi.responses"] = SimpleNamespace(HTMLResponse=StubElement, PlainTextResponse=StubElement)
+sys.modules["fastapi"] = SimpleNamespace(responses=sys.modules["fastapi.responses"])
+
+# Stub pylast and spotipy only where they aren't installed; the unit tests swap in
+# their own doubles, but real installs keep the real exception and constructor signatures
+class StubWSError(Exception):
+    """Stand-in for pylast.WSError so services can still catch it."""
+
+try:
+    import pylast  # noqa: F401
+except ImportError:
+    sys.modules["pylast"] = SimpleNamespace(WSError=StubWSError, LastFMNetwork=StubElement, Artist=StubElement)
+
+try:
+    import spotipy  # noqa: F401
+    import spotipy.oauth2  # noqa: F401
+except ImportError:
+    sys.modules["spotipy.oauth2"] = SimpleNamespace(SpotifyOAuth=StubElement)
+    sys.modules["spotipy"] = SimpleNamespace(Spotify=StubElement, oauth2=sys.modules["spotipy.oauth2"])
+
+def _freeze(value):
+    """Recursively turn dicts into read-only mapping proxies and lists into tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+_SAMPLE_PLAYLIST = _freeze({
+    'name': 'Test Playlist',
+    'description': 'Test Description',
+    'tracks': {'total': 10},
+    'owner': {'display_name': 'Test User'},
+    'images': [{'url': 'http://example.com/image.jpg'}],
+    'public': False,
+    'id': 'test123'
+})
+
+_SAMPLE_PLAYLIST_NO_IMAGE = _freeze({
+    'name': 'Test Playlist No Image',
+    'description': 'Test Description',
+    'tracks': {'total': 5},
+    'owner': {'display_name': 'Test User'},
+    'images': [],
+    'public': True,
+    'id': 'test456'
+})
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_playlist():
     """
-    Provide a sample playlist dictionary for tests.
+    Provide a sample playlist for tests.
+    
+    The playlist is shared across the session and frozen all the way down
+    (nested dicts are mapping proxies, lists are tuples); tests that need
+    different data should build a new dict, e.g. {**sample_playlist, 'name': ...}.
     """
-    return {
-        'name': 'Test Playlist',
-        'description': 'Test Description',
-        'tracks': {'total': 10},
-        'owner': {'display_name': 'Test User'},
-        'images': [{'url': 'http://example.com/image.jpg'}],
-        'public': False,
-        'id': 'test123'
-    }
+    return _SAMPLE_PLAYLIST
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_playlist_no_image():
     """
     Provide a sample playlist without images for tests.
+    
+    The playlist is shared across the session and frozen all the way down
+    (nested dicts are mapping proxies, lists are tuples); tests that need
+    different data should build a new dict, e.g. {**sample_playlist_no_image, 'name': ...}.
     """
-    return {
-        'name': 'Test Playlist No Image',
-        'description': 'Test Description',
-        'tracks': {'total': 5},
-        'owner': {'display_name': 'Test User'},
-        'images': [],
-        'public': True,
-        'id': 'test456'
-    } 
\ No newline at end of file
+    return _SAMPLE_PLAYLIST_NO_IMAGE
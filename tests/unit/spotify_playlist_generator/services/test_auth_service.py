@@ -1,574 +1,319 @@
 """
 Unit tests for the auth_service module.
 """
-import unittest
-from unittest.mock import patch, MagicMock
+import copy
+import os
+from types import SimpleNamespace
+from unittest.mock import Mock, call, patch
 
+import pytest
+
+import src.spotify_playlist_generator.services.auth_service as auth_mod
 from src.spotify_playlist_generator.services.auth_service import SpotifyAuthService
 
+# Keep this module on one xdist worker so the module-scoped patches are built once
+pytestmark = pytest.mark.xdist_group("auth_service")
 
-class TestSpotifyAuthService(unittest.TestCase):
-    """Test cases for the SpotifyAuthService class."""
-
-    @patch('src.spotify_playlist_generator.services.auth_service.os')
-    @patch('src.spotify_playlist_generator.services.auth_service.SpotifyOAuth')
-    def test_init(self, mock_spotify_oauth, mock_os):
-        """Test service initialization with environment variables."""
-        # Mock environment variables
-        mock_os.getenv.side_effect = lambda key, default=None: {
-            'SPOTIFY_CLIENT_ID': 'test_client_id',
-            'SPOTIFY_CLIENT_SECRET': 'test_client_secret',
-            'SPOTIFY_REDIRECT_URI': 'http://test.com/callback'
-        }.get(key, default)
-        
-        service = SpotifyAuthService()
-        
-        # Verify credentials were set from environment
-        self.assertEqual(service.client_id, 'test_client_id')
-        self.assertEqual(service.client_secret, 'test_client_secret')
-        self.assertEqual(service.redirect_uri, 'http://test.com/callback')
-        
-        # Verify OAuth was initialized
-        mock_spotify_oauth.assert_called_once()
-        self.assertIsNotNone(service.sp_oauth)
-
-    @patch('src.spotify_playlist_generator.services.auth_service.os')
-    @patch('src.spotify_playlist_generator.services.auth_service.SpotifyOAuth')
-    def test_init_missing_credentials(self, mock_spotify_oauth, mock_os):
-        """Test service initialization with missing credentials."""
-        # Mock missing environment variables
-        mock_os.getenv.side_effect = lambda key, default=None: {
-            'SPOTIFY_REDIRECT_URI': 'http://test.com/callback'
-        }.get(key, default)
-        
-        service = SpotifyAuthService()
-        
-        # Verify credentials are None or default
-        self.assertIsNone(service.client_id)
-        self.assertIsNone(service.client_secret)
-        self.assertEqual(service.redirect_uri, 'http://test.com/callback')
-        
-        # Verify OAuth was not initialized
-        mock_spotify_oauth.assert_not_called()
-        self.assertIsNone(service.sp_oauth)
-
-    @patch('src.spotify_playlist_generator.services.auth_service.os')
-    @patch('src.spotify_playlist_generator.services.auth_service.SpotifyOAuth')
-    def test_get_auth_url(self, mock_spotify_oauth, mock_os):
-        """Test getting authentication URL."""
-        # Mock environment variables
-        mock_os.getenv.side_effect = lambda key, default=None: {
-            'SPOTIFY_CLIENT_ID': 'test_client_id',
-            'SPOTIFY_CLIENT_SECRET': 'test_client_secret',
-            'SPOTIFY_REDIRECT_URI': 'http://test.com/callback'
-        }.get(key, default)
-        
-        # Set up the mock OAuth
-        mock_oauth_instance = mock_spotify_oauth.return_value
-        mock_oauth_instance.get_authorize_url.return_value = 'https://accounts.spotify.com/authorize?test_params'
-        
-        service = SpotifyAuthService()
-        auth_url = service.get_auth_url()
-        
-        # Verify the correct URL was returned
-        self.assertEqual(auth_url, 'https://accounts.spotify.com/authorize?test_params')
-        mock_oauth_instance.get_authorize_url.assert_called_once()
-
-    @patch('src.spotify_playlist_generator.services.auth_service.os')
-    @patch('src.spotify_playlist_generator.services.auth_service.SpotifyOAuth')
-    def test_get_auth_url_no_oauth_initializes(self, mock_spotify_oauth, mock_os):
-        """Test getting auth URL with uninitiated OAuth that successfully initializes."""
-        # Mock environment variables
-        mock_os.getenv.side_effect = lambda key, default=None: {
-            'SPOTIFY_CLIENT_ID': 'test_client_id',
-            'SPOTIFY_CLIENT_SECRET': 'test_client_secret',
-            'SPOTIFY_REDIRECT_URI': 'http://test.com/callback'
-        }.get(key, default)
-        
-        # Set up the mock OAuth
-        mock_oauth_instance = mock_spotify_oauth.return_value
-        mock_oauth_instance.get_authorize_url.return_value = 'https://accounts.spotify.com/authorize?test_params'
-        
-        # Create service and manually unset the OAuth instance
-        service = SpotifyAuthService()
-        service.sp_oauth = None
-        
-        # Call get_auth_url, which should initialize OAuth
-        auth_url = service.get_auth_url()
-        
-        # Verify OAuth was re-initialized and URL returned
-        self.assertEqual(auth_url, 'https://accounts.spotify.com/authorize?test_params')
-        # Should be called twice (once in init, once in get_auth_url)
-        self.assertEqual(mock_spotify_oauth.call_count, 2)
-
-    @patch('src.spotify_playlist_generator.services.auth_service.os')
-    @patch('src.spotify_playlist_generator.services.auth_service.SpotifyOAuth')
-    def test_get_auth_url_fails(self, mock_spotify_oauth, mock_os):
-        """Test getting auth URL when OAuth initialization fails."""
-        # Mock environment variables with missing credentials
-        mock_os.getenv.side_effect = lambda key, default=None: {
-            # Missing client_id and client_secret
-            'SPOTIFY_REDIRECT_URI': 'http://test.com/callback'
-        }.get(key, default)
-        
-        # Create service with no OAuth
-        service = SpotifyAuthService()
-        service.sp_oauth = None
-        
-        # Mock _initialize_oauth to ensure sp_oauth remains None
-        original_initialize = service._initialize_oauth
-        service._initialize_oauth = lambda: None
-        
-        # Attempt to get auth URL
-        with self.assertRaises(ValueError):
-            service.get_auth_url()
-        
-        # Restore original method
-        service._initialize_oauth = original_initialize
-
-    @patch('src.spotify_playlist_generator.services.auth_service.os')
-    @patch('src.spotify_playlist_generator.services.auth_service.SpotifyOAuth')
-    @patch('src.spotify_playlist_generator.services.auth_service.spotipy')
-    def test_authenticate_success(self, mock_spotipy, mock_spotify_oauth, mock_os):
-        """Test successful authentication with access code."""
-        # Mock environment variables
-        mock_os.getenv.side_effect = lambda key, default=None: {
-            'SPOTIFY_CLIENT_ID': 'test_client_id',
-            'SPOTIFY_CLIENT_SECRET': 'test_client_secret',
-            'SPOTIFY_REDIRECT_URI': 'http://test.com/callback'
-        }.get(key, default)
-        
-        # Set up mock OAuth and token
-        mock_oauth_instance = mock_spotify_oauth.return_value
-        mock_oauth_instance.get_access_token.return_value = {
-            'access_token': 'test_access_token',
-            'refresh_token': 'test_refresh_token',
-            'expires_at': 1234567890
-        }
-        
-        # Set up mock Spotify client
-        mock_spotify_instance = mock_spotipy.Spotify.return_value
-        mock_spotify_instance.current_user.return_value = {
-            'display_name': 'Test User',
-            'id': 'test_user_id'
-        }
-        
-        # Create service and authenticate
-        service = SpotifyAuthService()
-        result = service.authenticate('test_auth_code')
-        
-        # Verify authentication was successful
-        self.assertTrue(result)
-        mock_oauth_instance.get_access_token.assert_called_once_with(
-            'test_auth_code', as_dict=True, check_cache=False)
-        mock_spotipy.Spotify.assert_called_once_with(auth='test_access_token')
-        mock_spotify_instance.current_user.assert_called_once()
-        
-        # Verify token and client were stored
-        self.assertEqual(service.token_info['access_token'], 'test_access_token')
-        self.assertEqual(service.token_info['refresh_token'], 'test_refresh_token')
-        self.assertIsNotNone(service.client)
-        self.assertEqual(service.user_info['display_name'], 'Test User')
-
-    @patch('src.spotify_playlist_generator.services.auth_service.os')
-    @patch('src.spotify_playlist_generator.services.auth_service.SpotifyOAuth')
-    @patch('src.spotify_playlist_generator.services.auth_service.spotipy')
-    def test_authenticate_no_oauth(self, mock_spotipy, mock_spotify_oauth, mock_os):
-        """Test authentication when OAuth is not initialized."""
-        # Mock environment variables
-        mock_os.getenv.side_effect = lambda key, default=None: {
-            'SPOTIFY_CLIENT_ID': 'test_client_id',
-            'SPOTIFY_CLIENT_SECRET': 'test_client_secret',
-            'SPOTIFY_REDIRECT_URI': 'http://test.com/callback'
-        }.get(key, default)
-        
-        # Set up mock OAuth and token
-        mock_oauth_instance = mock_spotify_oauth.return_value
-        mock_oauth_instance.get_access_token.return_value = {
-            'access_token': 'test_access_token',
-            'refresh_token': 'test_refresh_token',
-            'expires_at': 1234567890
-        }
-        
-        # Set up mock Spotify client
-        mock_spotify_instance = mock_spotipy.Spotify.return_value
-        mock_spotify_instance.current_user.return_value = {
-            'display_name': 'Test User',
-            'id': 'test_user_id'
-        }
-        
-        # Create service with no OAuth
-        service = SpotifyAuthService()
-        service.sp_oauth = None
-        
-        # Authenticate
-        result = service.authenticate('test_auth_code')
-        
-        # Verify OAuth was initialized and authentication successful
-        self.assertTrue(result)
-        self.assertIsNotNone(service.sp_oauth)
-        mock_spotify_oauth.assert_called_with(
-            client_id='test_client_id',
-            client_secret='test_client_secret',
-            redirect_uri='http://test.com/callback',
-            scope="user-library-read playlist-read-private playlist-modify-private playlist-modify-public",
-            open_browser=False,
-            cache_handler=None
-        )
-
-    @patch('src.spotify_playlist_generator.services.auth_service.os')
-    @patch('src.spotify_playlist_generator.services.auth_service.SpotifyOAuth')
-    @patch('src.spotify_playlist_generator.services.auth_service.spotipy')
-    def test_authenticate_failure(self, mock_spotipy, mock_spotify_oauth, mock_os):
-        """Test authentication failure."""
-        # Mock environment variables
-        mock_os.getenv.side_effect = lambda key, default=None: {
-            'SPOTIFY_CLIENT_ID': 'test_client_id',
-            'SPOTIFY_CLIENT_SECRET': 'test_client_secret',
-            'SPOTIFY_REDIRECT_URI': 'http://test.com/callback'
-        }.get(key, default)
-        
-        # Set up mock OAuth to raise exception
-        mock_oauth_instance = mock_spotify_oauth.return_value
-        mock_oauth_instance.get_access_token.side_effect = Exception("Invalid code")
-        
-        # Create service and attempt authentication
-        service = SpotifyAuthService()
-        result = service.authenticate('invalid_code')
-        
-        # Verify authentication failed
-        self.assertFalse(result)
-        self.assertIsNone(service.token_info)
-        self.assertIsNone(service.client)
-        self.assertIsNone(service.user_info)
-
-    @patch('src.spotify_playlist_generator.services.auth_service.os')
-    @patch('src.spotify_playlist_generator.services.auth_service.SpotifyOAuth')
-    def test_check_token_no_token(self, mock_spotify_oauth, mock_os):
-        """Test check_token with no token."""
-        # Mock environment variables
-        mock_os.getenv.side_effect = lambda key, default=None: {
-            'SPOTIFY_CLIENT_ID': 'test_client_id',
-            'SPOTIFY_CLIENT_SECRET': 'test_client_secret',
-            'SPOTIFY_REDIRECT_URI': 'http://test.com/callback'
-        }.get(key, default)
-        
-        # Create service
-        service = SpotifyAuthService()
-        service.token_info = None
-        
-        # Check token
-        result = service.check_token()
-        
-        # Verify check fails with no token
-        self.assertFalse(result)
-
-    @patch('src.spotify_playlist_generator.services.auth_service.os')
-    @patch('src.spotify_playlist_generator.services.auth_service.SpotifyOAuth')
-    @patch('src.spotify_playlist_generator.services.auth_service.spotipy')
-    def test_check_token_expired(self, mock_spotipy, mock_spotify_oauth, mock_os):
-        """Test check_token with expired token that needs refresh."""
-        # Mock environment variables
-        mock_os.getenv.side_effect = lambda key, default=None: {
-            'SPOTIFY_CLIENT_ID': 'test_client_id',
-            'SPOTIFY_CLIENT_SECRET': 'test_client_secret',
-            'SPOTIFY_REDIRECT_URI': 'http://test.com/callback'
-        }.get(key, default)
-        
-        # Old token data
-        old_token = {
-            'access_token': 'old_access_token',
-            'refresh_token': 'old_refresh_token',
-            'expires_at': 1234567890
-        }
-        
-        # New token data after refresh
-        new_token = {
-            'access_token': 'new_access_token',
-            'refresh_token': 'new_refresh_token',
-            'expires_at': 1234567890
-        }
-        
-        # Set up mock OAuth
-        mock_oauth_instance = mock_spotify_oauth.return_value
-        mock_oauth_instance.is_token_expired.return_value = True
-        mock_oauth_instance.refresh_access_token.return_value = new_token
-        
-        # Set up mock Spotify client
-        mock_spotify_instance = mock_spotipy.Spotify.return_value
-        mock_spotify_instance.current_user.return_value = {
-            'display_name': 'Test User',
-            'id': 'test_user_id'
-        }
-        
-        # Create service with expired token
-        service = SpotifyAuthService()
-        service.token_info = old_token.copy()
-        
-        # Check token
-        result = service.check_token()
-        
-        # Verify token was refreshed
-        self.assertTrue(result)
-        mock_oauth_instance.is_token_expired.assert_called_once_with(old_token)
-        mock_oauth_instance.refresh_access_token.assert_called_once_with('old_refresh_token')
-        mock_spotipy.Spotify.assert_called_once_with(auth='new_access_token')
-        
-        # Verify token was updated
-        self.assertEqual(service.token_info['access_token'], 'new_access_token')
-        self.assertEqual(service.token_info['refresh_token'], 'new_refresh_token')
-
-    @patch('src.spotify_playlist_generator.services.auth_service.os')
-    @patch('src.spotify_playlist_generator.services.auth_service.SpotifyOAuth')
-    def test_check_token_expired_no_refresh_token(self, mock_spotify_oauth, mock_os):
-        """Test check_token with expired token but no refresh token."""
-        # Mock environment variables
-        mock_os.getenv.side_effect = lambda key, default=None: {
-            'SPOTIFY_CLIENT_ID': 'test_client_id',
-            'SPOTIFY_CLIENT_SECRET': 'test_client_secret',
-            'SPOTIFY_REDIRECT_URI': 'http://test.com/callback'
-        }.get(key, default)
-        
-        # Set up token with no refresh token
-        token_without_refresh = {
-            'access_token': 'old_access_token',
-            'expires_at': 1234567890
-            # No refresh_token key
-        }
-        
-        # Set up mock OAuth
-        mock_oauth_instance = mock_spotify_oauth.return_value
-        mock_oauth_instance.is_token_expired.return_value = True
-        
-        # Create service with token that has no refresh token
-        service = SpotifyAuthService()
-        service.token_info = token_without_refresh.copy()
-        
-        # Check token
-        result = service.check_token()
-        
-        # Verify check fails without refresh token
-        self.assertFalse(result)
-        mock_oauth_instance.is_token_expired.assert_called_once_with(token_without_refresh)
-        mock_oauth_instance.refresh_access_token.assert_not_called()
-
-    @patch('src.spotify_playlist_generator.services.auth_service.os')
-    @patch('src.spotify_playlist_generator.services.auth_service.SpotifyOAuth')
-    def test_check_token_refresh_error(self, mock_spotify_oauth, mock_os):
-        """Test check_token when refresh fails with exception."""
-        # Mock environment variables
-        mock_os.getenv.side_effect = lambda key, default=None: {
-            'SPOTIFY_CLIENT_ID': 'test_client_id',
-            'SPOTIFY_CLIENT_SECRET': 'test_client_secret',
-            'SPOTIFY_REDIRECT_URI': 'http://test.com/callback'
-        }.get(key, default)
-        
-        # Set up token with refresh token
-        token_with_refresh = {
-            'access_token': 'old_access_token',
-            'refresh_token': 'old_refresh_token',
-            'expires_at': 1234567890
-        }
-        
-        # Set up mock OAuth
-        mock_oauth_instance = mock_spotify_oauth.return_value
-        mock_oauth_instance.is_token_expired.return_value = True
-        mock_oauth_instance.refresh_access_token.side_effect = Exception("Refresh failed")
-        
-        # Create service with token
-        service = SpotifyAuthService()
-        service.token_info = token_with_refresh.copy()
-        
-        # Check token
-        result = service.check_token()
-        
-        # Verify check fails when refresh raises exception
-        self.assertFalse(result)
-        mock_oauth_instance.is_token_expired.assert_called_once_with(token_with_refresh)
-        mock_oauth_instance.refresh_access_token.assert_called_once_with('old_refresh_token')
-
-    @patch('src.spotify_playlist_generator.services.auth_service.os')
-    @patch('src.spotify_playlist_generator.services.auth_service.SpotifyOAuth')
-    def test_check_token_valid(self, mock_spotify_oauth, mock_os):
-        """Test check_token with valid token."""
-        # Mock environment variables
-        mock_os.getenv.side_effect = lambda key, default=None: {
-            'SPOTIFY_CLIENT_ID': 'test_client_id',
-            'SPOTIFY_CLIENT_SECRET': 'test_client_secret',
-            'SPOTIFY_REDIRECT_URI': 'http://test.com/callback'
-        }.get(key, default)
-        
-        # Set up mock OAuth
-        mock_oauth_instance = mock_spotify_oauth.return_value
-        mock_oauth_instance.is_token_expired.return_value = False
-        
-        # Create service with valid token and mock client
-        service = SpotifyAuthService()
-        service.token_info = {
-            'access_token': 'valid_access_token',
-            'refresh_token': 'valid_refresh_token',
-            'expires_at': 9999999999
-        }
-        service.client = MagicMock()
-        service.client.current_user.return_value = {
-            'display_name': 'Test User',
-            'id': 'test_user_id'
-        }
-        
-        # Check token
-        result = service.check_token()
-        
-        # Verify token is valid
-        self.assertTrue(result)
-        mock_oauth_instance.is_token_expired.assert_called_once_with(service.token_info)
-        service.client.current_user.assert_called_once()
-
-    @patch('src.spotify_playlist_generator.services.auth_service.os')
-    @patch('src.spotify_playlist_generator.services.auth_service.SpotifyOAuth')
-    def test_check_token_client_error(self, mock_spotify_oauth, mock_os):
-        """Test check_token when client verification fails."""
-        # Mock environment variables
-        mock_os.getenv.side_effect = lambda key, default=None: {
-            'SPOTIFY_CLIENT_ID': 'test_client_id',
-            'SPOTIFY_CLIENT_SECRET': 'test_client_secret',
-            'SPOTIFY_REDIRECT_URI': 'http://test.com/callback'
-        }.get(key, default)
-        
-        # Set up mock OAuth
-        mock_oauth_instance = mock_spotify_oauth.return_value
-        mock_oauth_instance.is_token_expired.return_value = False
-        
-        # Create service with valid token but problematic client
-        service = SpotifyAuthService()
-        service.token_info = {
-            'access_token': 'valid_access_token',
-            'refresh_token': 'valid_refresh_token',
-            'expires_at': 9999999999
-        }
-        
-        # Create mock client that raises exception
-        service.client = MagicMock()
-        service.client.current_user.side_effect = Exception("API Error")
-        
-        # Check token
-        result = service.check_token()
-        
-        # Verify check fails when client verification raises exception
-        self.assertFalse(result)
-        mock_oauth_instance.is_token_expired.assert_called_once_with(service.token_info)
-        service.client.current_user.assert_called_once()
-
-    @patch('src.spotify_playlist_generator.services.auth_service.os')
-    @patch('src.spotify_playlist_generator.services.auth_service.SpotifyOAuth')
-    def test_check_token_general_exception(self, mock_spotify_oauth, mock_os):
-        """Test check_token handling a general exception."""
-        # Mock environment variables
-        mock_os.getenv.side_effect = lambda key, default=None: {
-            'SPOTIFY_CLIENT_ID': 'test_client_id',
-            'SPOTIFY_CLIENT_SECRET': 'test_client_secret',
-            'SPOTIFY_REDIRECT_URI': 'http://test.com/callback'
-        }.get(key, default)
-        
-        # Set up mock OAuth to raise exception
-        mock_oauth_instance = mock_spotify_oauth.return_value
-        mock_oauth_instance.is_token_expired.side_effect = Exception("Unexpected error")
-        
-        # Create service with token
-        service = SpotifyAuthService()
-        service.token_info = {
-            'access_token': 'valid_access_token',
-            'refresh_token': 'valid_refresh_token',
-            'expires_at': 9999999999
-        }
-        
-        # Check token
-        result = service.check_token()
-        
-        # Verify check fails when an unexpected exception occurs
-        self.assertFalse(result)
-
-    @patch('src.spotify_playlist_generator.services.auth_service.os')
-    @patch('src.spotify_playlist_generator.services.auth_service.SpotifyOAuth')
-    def test_get_user_info(self, mock_spotify_oauth, mock_os):
-        """Test getting user info."""
-        # Mock environment variables
-        mock_os.getenv.side_effect = lambda key, default=None: {
-            'SPOTIFY_CLIENT_ID': 'test_client_id',
-            'SPOTIFY_CLIENT_SECRET': 'test_client_secret',
-            'SPOTIFY_REDIRECT_URI': 'http://test.com/callback'
-        }.get(key, default)
-        
-        # Create service
-        service = SpotifyAuthService()
-        service.user_info = {'display_name': 'Test User', 'id': 'test_user_id'}
-        
-        # Get user info
-        user_info = service.get_user_info()
-        
-        # Verify user info
-        self.assertEqual(user_info['display_name'], 'Test User')
-        self.assertEqual(user_info['id'], 'test_user_id')
-
-    @patch('src.spotify_playlist_generator.services.auth_service.os')
-    @patch('src.spotify_playlist_generator.services.auth_service.SpotifyOAuth')
-    def test_get_spotify_client(self, mock_spotify_oauth, mock_os):
-        """Test getting Spotify client."""
-        # Mock environment variables
-        mock_os.getenv.side_effect = lambda key, default=None: {
-            'SPOTIFY_CLIENT_ID': 'test_client_id',
-            'SPOTIFY_CLIENT_SECRET': 'test_client_secret',
-            'SPOTIFY_REDIRECT_URI': 'http://test.com/callback'
-        }.get(key, default)
-        
-        # Create service
-        service = SpotifyAuthService()
-        service.client = MagicMock()
-        
-        # Mock check_token to return True
-        service.check_token = MagicMock(return_value=True)
-        
-        # Get client
-        client = service.get_spotify_client()
-        
-        # Verify client is returned
-        self.assertEqual(client, service.client)
-        service.check_token.assert_called_once()
-        
-        # Mock check_token to return False
-        service.check_token = MagicMock(return_value=False)
-        
-        # Get client with invalid token
-        client = service.get_spotify_client()
-        
-        # Verify None is returned
-        self.assertIsNone(client)
-        service.check_token.assert_called_once()
-
-    @patch('src.spotify_playlist_generator.services.auth_service.os')
-    @patch('src.spotify_playlist_generator.services.auth_service.SpotifyOAuth')
-    def test_logout(self, mock_spotify_oauth, mock_os):
-        """Test logout functionality."""
-        # Mock environment variables
-        mock_os.getenv.side_effect = lambda key, default=None: {
-            'SPOTIFY_CLIENT_ID': 'test_client_id',
-            'SPOTIFY_CLIENT_SECRET': 'test_client_secret',
-            'SPOTIFY_REDIRECT_URI': 'http://test.com/callback'
-        }.get(key, default)
-        
-        # Create service
+_FULL_ENV = {
+    'SPOTIFY_CLIENT_ID': 'test_client_id',
+    'SPOTIFY_CLIENT_SECRET': 'test_client_secret',
+    'SPOTIFY_REDIRECT_URI': 'http://test.com/callback'
+}
+
+_MISSING_CREDS_ENV = {
+    'SPOTIFY_REDIRECT_URI': 'http://test.com/callback'
+}
+
+_AUTH_TOKEN = {
+    'access_token': 'test_access_token',
+    'refresh_token': 'test_refresh_token',
+    'expires_at': 1234567890
+}
+
+_OLD_TOKEN = {
+    'access_token': 'old_access_token',
+    'refresh_token': 'old_refresh_token',
+    'expires_at': 1234567890
+}
+
+_NEW_TOKEN = {
+    'access_token': 'new_access_token',
+    'refresh_token': 'new_refresh_token',
+    'expires_at': 1234567890
+}
+
+_NO_REFRESH_TOKEN = {
+    'access_token': 'old_access_token',
+    'expires_at': 1234567890
+    # No refresh_token key
+}
+
+_VALID_TOKEN = {
+    'access_token': 'valid_access_token',
+    'refresh_token': 'valid_refresh_token',
+    'expires_at': 9999999999
+}
+
+_USER = {'display_name': 'Test User', 'id': 'test_user_id'}
+
+_EXPECTED_SCOPE = "user-library-read playlist-read-private playlist-modify-private playlist-modify-public"
+
+
+def _generic_error():
+    """Build a fresh error for a mock to raise."""
+    return Exception("Test error")
+
+
+def _make_spotify_stub():
+    """Minimal spotipy.Spotify client double returning the test user."""
+    spotify = Mock()
+    spotify.current_user = Mock(return_value=_USER)
+    return spotify
+
+
+class _OAuthStub:
+    """Minimal SpotifyOAuth stand-in exposing only the methods the service calls."""
+
+    def __init__(self):
+        self.calls = []
+        self.get_authorize_url = Mock()
+        self.get_access_token = Mock()
+        self.is_token_expired = Mock()
+        self.refresh_access_token = Mock()
+
+    def __call__(self, **kwargs):
+        """Record a SpotifyOAuth(...) construction and hand back this stub."""
+        self.calls.append(kwargs)
+        return self
+
+    def reset(self):
+        """Clear recorded constructions and method configuration between tests."""
+        self.calls.clear()
+        for method in (self.get_authorize_url, self.get_access_token,
+                       self.is_token_expired, self.refresh_access_token):
+            method.reset_mock(return_value=True, side_effect=True)
+
+
+@pytest.fixture(scope="module")
+def patched_dependencies():
+    """Swap the auth_service module dependencies for mocks once per module."""
+    swapped = SimpleNamespace(oauth=_OAuthStub(), spotipy=Mock())
+    with patch.multiple(auth_mod, SpotifyOAuth=swapped.oauth, spotipy=swapped.spotipy):
+        yield swapped
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _patch_env():
+    """Expose only the full test environment for the whole module."""
+    with patch.dict(os.environ, _FULL_ENV, clear=True):
+        yield
+
+
+@pytest.fixture(scope="module")
+def template_service(_patch_env, patched_dependencies):
+    """Build one configured service to copy into each test."""
+    return SpotifyAuthService()
+
+
+@pytest.fixture(autouse=True)
+def mocks(patched_dependencies):
+    """Reset the shared mocks before each test."""
+    patched_dependencies.oauth.reset()
+    patched_dependencies.spotipy.reset_mock(return_value=True, side_effect=True)
+    return patched_dependencies
+
+
+@pytest.fixture
+def service(template_service, mocks):
+    """Fresh copy of the template bound to this test's OAuth mock."""
+    service = copy.copy(template_service)
+    service.sp_oauth = mocks.oauth
+    return service
+
+
+@pytest.mark.parametrize("env, expect_id, expect_secret, expect_oauth_called", [
+    pytest.param(_FULL_ENV, 'test_client_id', 'test_client_secret', True, id="full-env"),
+    pytest.param(_MISSING_CREDS_ENV, None, None, False, id="missing-credentials"),
+])
+def test_init(mocks, env, expect_id, expect_secret, expect_oauth_called):
+    """Test service initialization from the environment."""
+    with patch.dict(os.environ, env, clear=True):
         service = SpotifyAuthService()
-        service.token_info = {'access_token': 'test_token'}
-        service.client = MagicMock()
-        service.user_info = {'display_name': 'Test User'}
-        
-        # Logout
-        service.logout()
-        
-        # Verify state was cleared
-        self.assertIsNone(service.token_info)
-        self.assertIsNone(service.client)
-        self.assertIsNone(service.user_info)
-
-
-if __name__ == '__main__':
-    unittest.main() 
\ No newline at end of file
+
+    # Verify credentials were read from the environment
+    assert (service.client_id, service.client_secret, service.redirect_uri) == (
+        expect_id, expect_secret, 'http://test.com/callback')
+
+    # Verify OAuth is only initialized when credentials are present
+    assert len(mocks.oauth.calls) == (1 if expect_oauth_called else 0)
+    assert (service.sp_oauth is mocks.oauth) is expect_oauth_called
+
+
+def test_get_auth_url(service, mocks):
+    """Test getting authentication URL."""
+    oauth = mocks.oauth
+    oauth.get_authorize_url.return_value = 'https://accounts.spotify.com/authorize?test_params'
+
+    auth_url = service.get_auth_url()
+
+    # Verify the correct URL was returned
+    assert auth_url == 'https://accounts.spotify.com/authorize?test_params'
+    assert oauth.get_authorize_url.call_count == 1
+
+
+def test_get_auth_url_no_oauth_initializes(service, mocks):
+    """Test getting auth URL with uninitiated OAuth that successfully initializes."""
+    oauth = mocks.oauth
+    oauth.get_authorize_url.return_value = 'https://accounts.spotify.com/authorize?test_params'
+    service.sp_oauth = None
+
+    # Call get_auth_url, which should initialize OAuth
+    auth_url = service.get_auth_url()
+
+    # Verify OAuth was re-initialized and URL returned
+    assert auth_url == 'https://accounts.spotify.com/authorize?test_params'
+    assert len(mocks.oauth.calls) == 1
+
+
+def test_get_auth_url_fails(service):
+    """Test getting auth URL when OAuth initialization fails."""
+    service.sp_oauth = None
+
+    # Stub _initialize_oauth on this copy to ensure sp_oauth remains None
+    service._initialize_oauth = Mock()
+
+    with pytest.raises(ValueError):
+        service.get_auth_url()
+
+
+def test_authenticate_success(service, mocks):
+    """Test successful authentication with access code."""
+    oauth = mocks.oauth
+    oauth.get_access_token.return_value = _AUTH_TOKEN
+
+    spotify = mocks.spotipy.Spotify.return_value = _make_spotify_stub()
+
+    result = service.authenticate('test_auth_code')
+
+    # Verify authentication was successful
+    assert result is True
+    assert oauth.get_access_token.call_count == 1
+    assert oauth.get_access_token.call_args == call('test_auth_code', as_dict=True, check_cache=False)
+    assert mocks.spotipy.Spotify.call_count == 1
+    assert mocks.spotipy.Spotify.call_args == call(auth='test_access_token')
+    assert spotify.current_user.call_count == 1
+
+    # Verify token and client were stored
+    assert service.token_info['access_token'] == 'test_access_token'
+    assert service.token_info['refresh_token'] == 'test_refresh_token'
+    assert service.client is not None
+    assert service.user_info['display_name'] == 'Test User'
+
+
+def test_authenticate_no_oauth(service, mocks):
+    """Test authentication when OAuth is not initialized."""
+    oauth = mocks.oauth
+    oauth.get_access_token.return_value = _AUTH_TOKEN
+
+    mocks.spotipy.Spotify.return_value = _make_spotify_stub()
+    service.sp_oauth = None
+
+    result = service.authenticate('test_auth_code')
+
+    # Verify OAuth was initialized and authentication successful
+    assert result is True
+    assert service.sp_oauth is not None
+    assert mocks.oauth.calls[-1] == {
+        'client_id': 'test_client_id',
+        'client_secret': 'test_client_secret',
+        'redirect_uri': 'http://test.com/callback',
+        'scope': _EXPECTED_SCOPE,
+        'open_browser': False,
+        'cache_handler': None
+    }
+
+
+def test_authenticate_failure(service, mocks):
+    """Test authentication failure."""
+    oauth = mocks.oauth
+    oauth.get_access_token.side_effect = _generic_error()
+
+    result = service.authenticate('invalid_code')
+
+    # Verify authentication failed
+    assert result is False
+    assert service.token_info is None
+    assert service.client is None
+    assert service.user_info is None
+
+
+def test_check_token_expired(service, mocks):
+    """Test check_token with expired token that needs refresh."""
+    oauth = mocks.oauth
+    oauth.is_token_expired.return_value = True
+    oauth.refresh_access_token.return_value = _NEW_TOKEN
+
+    mocks.spotipy.Spotify.return_value = _make_spotify_stub()
+
+    service.token_info = _OLD_TOKEN
+
+    result = service.check_token()
+
+    # Verify token was refreshed
+    assert result is True
+    assert oauth.is_token_expired.call_count == 1
+    assert oauth.is_token_expired.call_args == call(_OLD_TOKEN)
+    assert oauth.refresh_access_token.call_count == 1
+    assert oauth.refresh_access_token.call_args == call('old_refresh_token')
+    assert mocks.spotipy.Spotify.call_count == 1
+    assert mocks.spotipy.Spotify.call_args == call(auth='new_access_token')
+
+    # Verify token was updated
+    assert service.token_info['access_token'] == 'new_access_token'
+    assert service.token_info['refresh_token'] == 'new_refresh_token'
+
+
+@pytest.mark.parametrize("token, is_expired, expired_error, refresh_error, verify_error, expected", [
+    pytest.param(None, False, None, None, None, False, id="no-token"),
+    pytest.param(_NO_REFRESH_TOKEN, True, None, None, None, False, id="expired-no-refresh-token"),
+    pytest.param(_OLD_TOKEN, True, None, _generic_error, None, False, id="refresh-error"),
+    pytest.param(_VALID_TOKEN, False, None, None, None, True, id="valid"),
+    pytest.param(_VALID_TOKEN, False, None, None, _generic_error, False, id="client-error"),
+    pytest.param(_VALID_TOKEN, False, _generic_error, None, None, False, id="general-exception"),
+])
+def test_check_token(service, mocks, token, is_expired, expired_error, refresh_error, verify_error, expected):
+    """Test check_token outcomes for the different token and client states."""
+    oauth = mocks.oauth
+    oauth.is_token_expired.return_value = is_expired
+    # Error cases are given as factories so each test raises a fresh exception
+    oauth.is_token_expired.side_effect = expired_error() if expired_error else None
+    oauth.refresh_access_token.side_effect = refresh_error() if refresh_error else None
+
+    service.token_info = token
+    service.client = Mock()
+    service.client.current_user.side_effect = verify_error() if verify_error else None
+
+    assert service.check_token() is expected
+
+
+def test_trivial_accessors(service):
+    """Test get_user_info, get_spotify_client and logout on one service."""
+    client = Mock()
+    service.user_info = _USER
+    service.client = client
+    service.token_info = {'access_token': 'test_token'}
+
+    assert service.get_user_info() is _USER
+
+    # Client is only returned while the token checks out
+    service.check_token = lambda: True
+    assert service.get_spotify_client() is client
+    service.check_token = lambda: False
+    assert service.get_spotify_client() is None
+
+    service.logout()
+
+    # Verify state was cleared
+    assert service.token_info is None
+    assert service.client is None
+    assert service.user_info is None
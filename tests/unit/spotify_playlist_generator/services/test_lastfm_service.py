@@ -1,249 +1,227 @@
 """
 Unit tests for LastFM service.
 """
-import unittest
-from unittest.mock import patch, MagicMock
+import copy
 import os
+from types import SimpleNamespace
+from unittest.mock import call, patch, sentinel, MagicMock
+
 import pylast
+import pytest
 
+from src.spotify_playlist_generator.services import lastfm_service
 from src.spotify_playlist_generator.services.lastfm_service import LastFMService
 
-class TestLastFMService(unittest.TestCase):
-    """Tests for the LastFM service."""
-
-    def setUp(self):
-        """Set up test environment."""
-        # Patch environment variables to ensure they don't affect tests
-        self.env_patcher = patch.dict('os.environ', {
-            'LASTFM_API_KEY': 'test_api_key',
-            'LASTFM_SHARED_SECRET': 'test_shared_secret'
-        })
-        self.env_patcher.start()
-        
-    def tearDown(self):
-        """Clean up test environment."""
-        self.env_patcher.stop()
-
-    def test_init_with_explicit_credentials(self):
-        """Test initialization with explicitly provided credentials."""
-        service = LastFMService(api_key='explicit_key', shared_secret='explicit_secret')
-        
-        self.assertEqual(service.api_key, 'explicit_key')
-        self.assertEqual(service.shared_secret, 'explicit_secret')
-        
-    def test_init_with_environment_variables(self):
-        """Test initialization using environment variables."""
+
+def _generic_error():
+    """Build a fresh generic error for a mock to raise."""
+    return Exception("Test error")
+
+
+def _ws_error():
+    """Build a fresh LastFM web service error."""
+    return pylast.WSError("API error", 400, "error details")
+
+
+@pytest.fixture(scope="module", autouse=True)
+def lastfm_env():
+    """Patch environment variables once so they don't affect tests."""
+    with patch.dict(os.environ, {
+        'LASTFM_API_KEY': 'test_api_key',
+        'LASTFM_SHARED_SECRET': 'test_shared_secret'
+    }):
+        yield
+
+
+@pytest.fixture
+def mocks():
+    """Build fresh network and artist mocks for each test."""
+    network, artist = MagicMock(), MagicMock()
+    network.get_artist.return_value = artist
+    return SimpleNamespace(network=network, artist=artist)
+
+
+@pytest.fixture
+def patched_lastfm_network(mocks):
+    """Swap in a LastFMNetwork factory that returns the shared network mock."""
+    with patch.object(lastfm_service.pylast, 'LastFMNetwork', MagicMock(return_value=mocks.network)) as factory:
+        yield factory, mocks.network
+
+
+@pytest.fixture(scope="module")
+def _template_service():
+    """Build one connected service to copy into each test."""
+    with patch.object(lastfm_service.pylast, 'LastFMNetwork', MagicMock()):
+        return LastFMService(api_key='test_key', shared_secret='test_secret')
+
+
+@pytest.fixture
+def fresh_service(_template_service):
+    """Return a factory producing a copy of the template with the given network."""
+    def make(network=None):
+        service = copy.copy(_template_service)
+        service.network = network
+        return service
+    return make
+
+
+@pytest.mark.parametrize("kwargs, expect_key, expect_secret", [
+    pytest.param({'api_key': 'explicit_key', 'shared_secret': 'explicit_secret'},
+                 'explicit_key', 'explicit_secret', id="explicit"),
+    pytest.param({}, 'test_api_key', 'test_shared_secret', id="environment"),
+])
+def test_init_credentials(kwargs, expect_key, expect_secret):
+    """Test initialization with explicit credentials or from environment variables."""
+    service = LastFMService(**kwargs)
+
+    assert service.api_key == expect_key
+    assert service.shared_secret == expect_secret
+
+
+def test_connect_success(patched_lastfm_network):
+    """Test successful connection to LastFM API."""
+    mock_lastfm_network, mock_network = patched_lastfm_network
+
+    service = LastFMService(api_key='test_key', shared_secret='test_secret')
+    result = service.connect()
+
+    assert result is True
+    assert service.network == mock_network
+    # The constructor connects too, so compare the most recent call only
+    assert mock_lastfm_network.call_args == call(api_key='test_key', api_secret='test_secret')
+
+
+def test_connect_missing_credentials(patched_lastfm_network):
+    """Test connection failure due to missing credentials."""
+    mock_lastfm_network, _ = patched_lastfm_network
+
+    # Create service with no credentials
+    with patch.dict(os.environ, {}, clear=True):
         service = LastFMService()
-        
-        self.assertEqual(service.api_key, 'test_api_key')
-        self.assertEqual(service.shared_secret, 'test_shared_secret')
-    
-    @patch('src.spotify_playlist_generator.services.lastfm_service.pylast.LastFMNetwork')
-    def test_connect_success(self, mock_lastfm_network):
-        """Test successful connection to LastFM API."""
-        # Set up mock
-        mock_network = MagicMock()
-        mock_lastfm_network.return_value = mock_network
-        
-        # Create service and test connect
-        service = LastFMService(api_key='test_key', shared_secret='test_secret')
-        result = service.connect()
-        
-        # Assertions
-        self.assertTrue(result)
-        self.assertEqual(service.network, mock_network)
-        mock_lastfm_network.assert_has_calls([
-            unittest.mock.call(
-                api_key='test_key',
-                api_secret='test_secret'
-            )
-        ])
-        
-    @patch('src.spotify_playlist_generator.services.lastfm_service.pylast.LastFMNetwork')
-    def test_connect_missing_credentials(self, mock_lastfm_network):
-        """Test connection failure due to missing credentials."""
-        # Create service with no credentials
-        with patch.dict('os.environ', {}, clear=True):
-            service = LastFMService()
-            result = service.connect()
-        
-        # Assertions
-        self.assertFalse(result)
-        self.assertIsNone(service.network)
-        mock_lastfm_network.assert_not_called()
-        
-    @patch('src.spotify_playlist_generator.services.lastfm_service.pylast.LastFMNetwork')
-    def test_connect_exception(self, mock_lastfm_network):
-        """Test handling of exception during connection."""
-        # Set up mock to raise exception
-        mock_lastfm_network.side_effect = Exception("Connection error")
-        
-        # Create service and test connect
-        service = LastFMService(api_key='test_key', shared_secret='test_secret')
         result = service.connect()
-        
-        # Assertions
-        self.assertFalse(result)
-        self.assertIsNone(service.network)
-        
-    def test_get_similar_artists_no_network(self):
-        """Test getting similar artists with no network connection."""
-        # Create service with no network
-        service = LastFMService()
-        service.network = None
-        
-        # Call method
-        result = service.get_similar_artists("Test Artist")
-        
-        # Assertions
-        self.assertEqual(result, [])
-        
-    @patch('pylast.Artist')
-    @patch('src.spotify_playlist_generator.services.lastfm_service.pylast.LastFMNetwork')
-    def test_get_similar_artists_success(self, mock_lastfm_network, mock_artist):
-        """Test getting similar artists successfully."""
-        # Set up mocks
-        mock_network = MagicMock()
-        mock_lastfm_network.return_value = mock_network
-        
-        mock_network.get_artist.return_value = mock_artist
-        
-        # Set up similar artists
-        similar_artist1 = MagicMock()
-        similar_artist1.get_mbid.return_value = "mbid1"
-        similar_artist1.get_name.return_value = "Similar Artist 1"
-        similar_artist1.get_url.return_value = "http://example.com/artist1"
-        
-        similar_artist2 = MagicMock()
-        similar_artist2.get_mbid.return_value = None  # Test missing MBID
-        similar_artist2.get_name.return_value = "Similar Artist 2"
-        similar_artist2.get_url.return_value = "http://example.com/artist2"
-        
-        mock_artist.get_similar.return_value = [
-            (similar_artist1, 0.9),
-            (similar_artist2, 0.8)
-        ]
-        
-        # Create service
-        service = LastFMService()
-        
-        # Call method
-        result = service.get_similar_artists("Test Artist", limit=2)
-        
-        # Assertions
-        self.assertEqual(len(result), 2)
-        
-        self.assertEqual(result[0]["id"], "mbid1")
-        self.assertEqual(result[0]["name"], "Similar Artist 1")
-        self.assertEqual(result[0]["match"], 0.9)
-        self.assertEqual(result[0]["url"], "http://example.com/artist1")
-        
-        self.assertEqual(result[1]["id"], "")  # Empty string for missing MBID
-        self.assertEqual(result[1]["name"], "Similar Artist 2")
-        self.assertEqual(result[1]["match"], 0.8)
-        self.assertEqual(result[1]["url"], "http://example.com/artist2")
-        
-        # Verify the limit was passed
-        mock_artist.get_similar.assert_called_once_with(limit=2)
-        
-    @patch('src.spotify_playlist_generator.services.lastfm_service.pylast.LastFMNetwork')
-    def test_get_similar_artists_ws_error(self, mock_lastfm_network):
-        """Test handling of WSError when getting similar artists."""
-        # Set up mocks
-        mock_network = MagicMock()
-        mock_lastfm_network.return_value = mock_network
-        
-        mock_artist = MagicMock()
-        mock_network.get_artist.return_value = mock_artist
-        
-        # Make get_similar raise WSError
-        mock_artist.get_similar.side_effect = pylast.WSError("API error", 400, "error details")
-        
-        # Create service
-        service = LastFMService()
-        
-        # Call method
-        result = service.get_similar_artists("Test Artist")
-        
-        # Assertions
-        self.assertEqual(result, [])
-        
-    @patch('src.spotify_playlist_generator.services.lastfm_service.pylast.LastFMNetwork')
-    def test_get_similar_artists_general_exception(self, mock_lastfm_network):
-        """Test handling of general exception when getting similar artists."""
-        # Set up mocks
-        mock_network = MagicMock()
-        mock_lastfm_network.return_value = mock_network
-        
-        mock_artist = MagicMock()
-        mock_network.get_artist.return_value = mock_artist
-        
-        # Make get_similar raise Exception
-        mock_artist.get_similar.side_effect = Exception("General error")
-        
-        # Create service
-        service = LastFMService()
-        
-        # Call method
-        result = service.get_similar_artists("Test Artist")
-        
-        # Assertions
-        self.assertEqual(result, [])
-        
-    def test_test_connection_no_network(self):
-        """Test connection test with no network."""
-        # Create service with no network
-        service = LastFMService()
-        service.network = None
-        
-        # Call method
-        result = service.test_connection()
-        
-        # Assertions
-        self.assertFalse(result["success"])
-        self.assertEqual(result["message"], "Not connected to LastFM API")
-        self.assertIsNone(result["data"])
-        
-    @patch('src.spotify_playlist_generator.services.lastfm_service.LastFMService.get_similar_artists')
-    def test_test_connection_success(self, mock_get_similar):
-        """Test successful connection test."""
-        # Set up mock
-        mock_similar_artists = [
-            {"name": "Similar Artist 1"},
-            {"name": "Similar Artist 2"}
-        ]
-        mock_get_similar.return_value = mock_similar_artists
-        
-        # Create service
-        service = LastFMService()
-        service.network = MagicMock()  # Just need a non-None value
-        
-        # Call method
-        result = service.test_connection("Test Artist")
-        
-        # Assertions
-        self.assertTrue(result["success"])
-        self.assertEqual(result["message"], "Successfully retrieved 2 similar artists for Test Artist")
-        self.assertEqual(result["data"], mock_similar_artists)
-        mock_get_similar.assert_called_once_with("Test Artist", limit=5)
-        
-    @patch('src.spotify_playlist_generator.services.lastfm_service.LastFMService.get_similar_artists')
-    def test_test_connection_exception(self, mock_get_similar):
-        """Test handling of exception during connection test."""
-        # Set up mock to raise exception
-        mock_get_similar.side_effect = Exception("Test error")
-        
-        # Create service
-        service = LastFMService()
-        service.network = MagicMock()  # Just need a non-None value
-        
-        # Call method
-        result = service.test_connection()
-        
-        # Assertions
-        self.assertFalse(result["success"])
-        self.assertEqual(result["message"], "Error testing LastFM API: Test error")
-        self.assertIsNone(result["data"])
+
+    assert result is False
+    assert service.network is None
+    mock_lastfm_network.assert_not_called()
+
+
+def test_connect_exception(patched_lastfm_network):
+    """Test handling of exception during connection."""
+    mock_lastfm_network, _ = patched_lastfm_network
+    mock_lastfm_network.side_effect = _generic_error()
+
+    service = LastFMService(api_key='test_key', shared_secret='test_secret')
+    result = service.connect()
+
+    assert result is False
+    assert service.network is None
+
+
+def test_get_similar_artists_no_network(fresh_service):
+    """Test getting similar artists with no network connection."""
+    # Create service with no network
+    service = fresh_service()
+
+    assert service.get_similar_artists("Test Artist") == []
+
+
+def test_get_similar_artists_success(mocks, fresh_service):
+    """Test getting similar artists successfully."""
+    # Set up similar artists; only their return values are read, so skip mock call tracking
+    similar_artist1 = SimpleNamespace(
+        get_mbid=lambda: sentinel.mbid1,
+        get_name=lambda: sentinel.name1,
+        get_url=lambda: sentinel.url1
+    )
+
+    similar_artist2 = SimpleNamespace(
+        get_mbid=lambda: None,  # Test missing MBID
+        get_name=lambda: sentinel.name2,
+        get_url=lambda: sentinel.url2
+    )
+
+    mocks.artist.get_similar.return_value = [
+        (similar_artist1, 0.9),
+        (similar_artist2, 0.8)
+    ]
+
+    service = fresh_service(mocks.network)
+
+    result = service.get_similar_artists("Test Artist", limit=2)
+
+    assert len(result) == 2
+
+    assert result[0]["id"] is sentinel.mbid1
+    assert result[0]["name"] is sentinel.name1
+    assert result[0]["match"] == 0.9
+    assert result[0]["url"] is sentinel.url1
+
+    assert result[1]["id"] == ""  # Empty string for missing MBID
+    assert result[1]["name"] is sentinel.name2
+    assert result[1]["match"] == 0.8
+    assert result[1]["url"] is sentinel.url2
+
+    # Verify the limit was passed
+    mocks.artist.get_similar.assert_called_once_with(limit=2)
+
+
+@pytest.mark.parametrize("make_error", [
+    pytest.param(_ws_error, id="ws-error"),
+    pytest.param(_generic_error, id="general-exception"),
+])
+def test_get_similar_artists_error(mocks, fresh_service, make_error):
+    """Test handling of errors raised when getting similar artists."""
+    mocks.artist.get_similar.side_effect = make_error()
+
+    service = fresh_service(mocks.network)
+
+    assert service.get_similar_artists("Test Artist") == []
+
+
+def test_test_connection_no_network(fresh_service):
+    """Test connection test with no network."""
+    # Create service with no network
+    service = fresh_service()
+
+    result = service.test_connection()
+
+    assert result["success"] is False
+    assert result["message"] == "Not connected to LastFM API"
+    assert result["data"] is None
+
+
+def test_test_connection_success(fresh_service):
+    """Test successful connection test."""
+    mock_similar_artists = [
+        {"name": "Similar Artist 1"},
+        {"name": "Similar Artist 2"}
+    ]
+
+    service = fresh_service(object())  # Just need a non-None network
+    service.get_similar_artists = MagicMock(return_value=mock_similar_artists)
+
+    result = service.test_connection("Test Artist")
+
+    assert result["success"] is True
+    assert result["message"] == "Successfully retrieved 2 similar artists for Test Artist"
+    assert result["data"] == mock_similar_artists
+    service.get_similar_artists.assert_called_once_with("Test Artist", limit=5)
+
+
+def test_test_connection_exception(fresh_service):
+    """Test handling of exception during connection test."""
+    service = fresh_service(object())  # Just need a non-None network
+
+    def failing_get_similar_artists(artist_name, limit=5):
+        raise _generic_error()
+    service.get_similar_artists = failing_get_similar_artists
+
+    result = service.test_connection()
+
+    assert result["success"] is False
+    assert result["message"] == "Error testing LastFM API: Test error"
+    assert result["data"] is None
+
 
 if __name__ == '__main__':
-    unittest.main() 
\ No newline at end of file
+    raise SystemExit(pytest.main([__file__]))
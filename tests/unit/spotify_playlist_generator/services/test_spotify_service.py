@@ -1,584 +1,544 @@
 """
 Unit tests for the spotify_service module.
 """
-import unittest
-from unittest.mock import patch, MagicMock
-
-from src.spotify_playlist_generator.services.spotify_service import SpotifyService
-
-
-class TestSpotifyService(unittest.TestCase):
-    """Test cases for the SpotifyService class."""
-
-    def test_init(self):
-        """Test service initialization."""
-        # Create with no client
-        service = SpotifyService()
-        self.assertIsNone(service.client)
-        
-        # Create with mock client
-        mock_client = MagicMock()
-        service_with_client = SpotifyService(spotify_client=mock_client)
-        self.assertEqual(service_with_client.client, mock_client)
-    
-    @patch('src.spotify_playlist_generator.services.spotify_service.spotipy.Spotify')
-    @patch('src.spotify_playlist_generator.services.spotify_service.SpotifyOAuth')
-    def test_authenticate_success(self, mock_spotify_oauth, mock_spotify):
-        """Test successful authentication."""
-        # Set up mocks
-        mock_spotify_instance = mock_spotify.return_value
-        mock_auth_manager = mock_spotify_oauth.return_value
-        
-        # Create service
-        service = SpotifyService()
-        
-        # Test authentication
-        result = service.authenticate(
-            client_id='test_client_id',
-            client_secret='test_client_secret',
-            redirect_uri='http://test.com/callback'
-        )
-        
-        # Verify authentication
-        self.assertTrue(result)
-        mock_spotify_oauth.assert_called_once_with(
-            client_id='test_client_id',
-            client_secret='test_client_secret',
-            redirect_uri='http://test.com/callback',
-            scope="user-library-read playlist-read-private playlist-modify-private playlist-modify-public"
-        )
-        mock_spotify.assert_called_once_with(auth_manager=mock_auth_manager)
-        mock_spotify_instance.current_user.assert_called_once()
-        self.assertEqual(service.client, mock_spotify_instance)
-    
-    @patch('src.spotify_playlist_generator.services.spotify_service.spotipy.Spotify')
-    @patch('src.spotify_playlist_generator.services.spotify_service.SpotifyOAuth')
-    def test_authenticate_failure(self, mock_spotify_oauth, mock_spotify):
-        """Test authentication failure."""
-        # Set up mocks
-        mock_spotify_instance = mock_spotify.return_value
-        mock_spotify_instance.current_user.side_effect = Exception("Authentication error")
-        
-        # Create service
-        service = SpotifyService()
-        
-        # Test authentication
-        result = service.authenticate(
-            client_id='test_client_id',
-            client_secret='test_client_secret',
-            redirect_uri='http://test.com/callback'
-        )
-        
-        # Verify authentication failed
-        self.assertFalse(result)
-    
-    def test_get_user_playlists_no_client(self):
-        """Test getting playlists with no client."""
-        # Create service with no client
-        service = SpotifyService()
-        
-        # Get playlists
-        playlists = service.get_user_playlists()
-        
-        # Verify empty list is returned
-        self.assertEqual(playlists, [])
-    
-    def test_get_user_playlists_success(self):
-        """Test getting playlists successfully."""
-        # Create mock client
-        mock_client = MagicMock()
-        mock_client.current_user_playlists.return_value = {
-            'items': [
-                {
-                    'id': 'playlist1',
-                    'name': 'Playlist 1',
-                    'description': 'Test playlist 1',
-                    'owner': {'display_name': 'Test User'},
-                    'images': [{'url': 'http://example.com/image1.jpg'}],
-                    'tracks': {'total': 10}
-                },
-                {
-                    'id': 'playlist2',
-                    'name': 'Playlist 2',
-                    'description': 'Test playlist 2',
-                    'owner': {'display_name': 'Test User'},
-                    'images': [],  # Empty images
-                    'tracks': {'total': 5}
-                }
-            ]
-        }
-        
-        # Create service with mock client
-        service = SpotifyService(spotify_client=mock_client)
-        
-        # Get playlists
-        playlists = service.get_user_playlists(limit=10, offset=0)
-        
-        # Verify playlists are returned
-        self.assertEqual(len(playlists), 2)
-        self.assertEqual(playlists[0]['id'], 'playlist1')
-        self.assertEqual(playlists[1]['id'], 'playlist2')
-        
-        # Verify missing images were handled
-        self.assertIsNotNone(playlists[1]['images'])
-        self.assertIsNone(playlists[1]['images'][0]['url'])
-        
-        # Verify client was called with correct params
-        mock_client.current_user_playlists.assert_called_once_with(limit=10, offset=0)
-    
-    def test_get_user_playlists_with_missing_tracks(self):
-        """Test getting playlists with missing tracks field."""
-        # Create mock client
-        mock_client = MagicMock()
-        mock_client.current_user_playlists.return_value = {
-            'items': [
-                {
-                    'id': 'playlist1',
-                    'name': 'Playlist 1',
-                    'description': 'Test playlist 1',
-                    'owner': {'display_name': 'Test User'},
-                    'images': [{'url': 'http://example.com/image1.jpg'}]
-                    # Missing 'tracks' field
-                }
-            ]
+import copy
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.spotify_playlist_generator.services import spotify_service
+from src.spotify_playlist_generator.services.spotify_service import SCOPE, SpotifyService
+
+# Keep this module on one xdist worker so the module-scoped mocks are built once
+pytestmark = pytest.mark.xdist_group("spotify_service")
+
+# spotipy.Spotify methods the service calls; spotipy is stubbed in conftest, so the
+# client template is specced against these names rather than the real class
+_CLIENT_METHODS = ('current_user_playlists', 'playlist_tracks', 'current_user_saved_tracks', 'next',
+                   'playlist_add_items', 'audio_features', 'search')
+
+_CLIENT_ID = 'test_client_id'
+_CLIENT_SECRET = 'test_client_secret'
+_REDIRECT_URI = 'http://test.com/callback'
+
+
+def _api_error():
+    """Build a fresh API error per test, so raised tracebacks never pile up on a shared instance."""
+    return Exception("API error")
+
+
+def _forbidden_error():
+    """Build a fresh 403 error for the audio features fallback."""
+    return Exception("403 Forbidden")
+
+
+_PLAYLISTS_RESPONSE = {
+    'items': [
+        {
+            'id': 'playlist1',
+            'name': 'Playlist 1',
+            'description': 'Test playlist 1',
+            'owner': {'display_name': 'Test User'},
+            'images': [{'url': 'http://example.com/image1.jpg'}],
+            'tracks': {'total': 10}
+        },
+        {
+            'id': 'playlist2',
+            'name': 'Playlist 2',
+            'description': 'Test playlist 2',
+            'owner': {'display_name': 'Test User'},
+            'images': [],  # Empty images
+            'tracks': {'total': 5}
         }
-        
-        # Create service with mock client
-        service = SpotifyService(spotify_client=mock_client)
-        
-        # Get playlists
-        playlists = service.get_user_playlists()
-        
-        # Verify tracks field was added
-        self.assertEqual(len(playlists), 1)
-        self.assertEqual(playlists[0]['id'], 'playlist1')
-        self.assertIn('tracks', playlists[0])
-        self.assertEqual(playlists[0]['tracks']['total'], 0)
-    
-    def test_get_user_playlists_error(self):
-        """Test error handling when getting playlists."""
-        # Create mock client that raises exception
-        mock_client = MagicMock()
-        mock_client.current_user_playlists.side_effect = Exception("API error")
-        
-        # Create service with mock client
-        service = SpotifyService(spotify_client=mock_client)
-        
-        # Get playlists
-        playlists = service.get_user_playlists()
-        
-        # Verify empty list is returned on error
-        self.assertEqual(playlists, [])
-    
-    def test_get_playlist_tracks_no_client(self):
-        """Test getting playlist tracks with no client."""
-        # Create service with no client
-        service = SpotifyService()
-        
-        # Get tracks
-        tracks = service.get_playlist_tracks('playlist1')
-        
-        # Verify empty list is returned
-        self.assertEqual(tracks, [])
-    
-    def test_get_playlist_tracks_success(self):
-        """Test getting playlist tracks successfully."""
-        # Create mock client
-        mock_client = MagicMock()
-        mock_client.playlist_tracks.return_value = {
-            'items': [
-                {
-                    'track': {
-                        'id': 'track1',
-                        'name': 'Track 1',
-                        'uri': 'spotify:track:track1',
-                        'duration_ms': 180000,
-                        'artists': [{'name': 'Artist 1'}],
-                        'album': {'name': 'Album 1', 'images': []},
-                        'external_urls': {'spotify': 'https://open.spotify.com/track/track1'}
-                    }
-                },
-                {
-                    'track': {
-                        'id': 'track2',
-                        'name': 'Track 2',
-                        'uri': 'spotify:track:track2',
-                        'duration_ms': 210000,
-                        'artists': [{'name': 'Artist 2'}],
-                        'album': {'name': 'Album 2', 'images': []},
-                        'external_urls': {'spotify': 'https://open.spotify.com/track/track2'}
-                    }
-                }
-            ]
+    ]
+}
+
+# A full page followed by a short page
+_PLAYLIST_PAGES = [
+    {'items': [{'id': 'playlist1', 'images': [], 'tracks': {'total': 1}},
+               {'id': 'playlist2', 'images': [], 'tracks': {'total': 2}}]},
+    {'items': [{'id': 'playlist3', 'images': [], 'tracks': {'total': 3}}]}
+]
+
+# _PLAYLISTS_RESPONSE items after the service fills in missing images
+_EXPECTED_PLAYLISTS = [
+    _PLAYLISTS_RESPONSE['items'][0],
+    {**_PLAYLISTS_RESPONSE['items'][1], 'images': [{'url': None}]}
+]
+
+_MISSING_TRACKS_RESPONSE = {
+    'items': [
+        {
+            'id': 'playlist1',
+            'name': 'Playlist 1',
+            'description': 'Test playlist 1',
+            'owner': {'display_name': 'Test User'},
+            'images': [{'url': 'http://example.com/image1.jpg'}]
+            # Missing 'tracks' field
         }
-        
-        # Create service with mock client
-        service = SpotifyService(spotify_client=mock_client)
-        
-        # Get tracks
-        tracks = service.get_playlist_tracks('playlist1', limit=50, offset=0)
-        
-        # Verify tracks are returned
-        self.assertEqual(len(tracks), 2)
-        self.assertEqual(tracks[0]['track']['id'], 'track1')
-        self.assertEqual(tracks[1]['track']['id'], 'track2')
-        
-        # Verify client was called with correct params
-        mock_client.playlist_tracks.assert_called_once_with(
-            'playlist1',
-            limit=50,
-            offset=0,
-            fields='items(track(id,name,uri,duration_ms,artists(id,name),album(id,name,images),external_urls))'
-        )
-    
-    def test_get_playlist_tracks_error(self):
-        """Test error handling when getting playlist tracks."""
-        # Create mock client that raises exception
-        mock_client = MagicMock()
-        mock_client.playlist_tracks.side_effect = Exception("API error")
-        
-        # Create service with mock client
-        service = SpotifyService(spotify_client=mock_client)
-        
-        # Get tracks
-        tracks = service.get_playlist_tracks('playlist1')
-        
-        # Verify empty list is returned on error
-        self.assertEqual(tracks, [])
-
-    def test_get_playlist_tracks_with_missing_fields(self):
-        """Test getting playlist tracks with missing fields."""
-        # Create mock client with incomplete track data
-        mock_client = MagicMock()
-        mock_client.playlist_tracks.return_value = {
-            'items': [
-                {
-                    'track': {
-                        'id': 'track1',
-                        'name': 'Track 1',
-                        # Missing 'artists' field
-                        # Missing 'album' field
-                        # Missing 'external_urls' field
-                    }
-                },
-                {
-                    'track': None  # Track is None
-                },
-                {
-                    # Missing 'track' field entirely
-                }
-            ]
+    ]
+}
+
+_TRACKS_RESPONSE = {
+    'items': [
+        {
+            'track': {
+                'id': 'track1',
+                'name': 'Track 1',
+                'uri': 'spotify:track:track1',
+                'duration_ms': 180000,
+                'artists': [{'name': 'Artist 1'}],
+                'album': {'name': 'Album 1', 'images': []},
+                'external_urls': {'spotify': 'https://open.spotify.com/track/track1'}
+            }
+        },
+        {
+            'track': {
+                'id': 'track2',
+                'name': 'Track 2',
+                'uri': 'spotify:track:track2',
+                'duration_ms': 210000,
+                'artists': [{'name': 'Artist 2'}],
+                'album': {'name': 'Album 2', 'images': []},
+                'external_urls': {'spotify': 'https://open.spotify.com/track/track2'}
+            }
         }
-        
-        # Create service with mock client
-        service = SpotifyService(spotify_client=mock_client)
-        
-        # Get tracks
-        tracks = service.get_playlist_tracks('playlist1')
-        
-        # Verify valid tracks are returned and invalid ones filtered out
-        self.assertEqual(len(tracks), 1)
-        
-        # Verify fields were added
-        self.assertIn('artists', tracks[0]['track'])
-        self.assertEqual(tracks[0]['track']['artists'], [])
-        
-        self.assertIn('album', tracks[0]['track'])
-        self.assertEqual(tracks[0]['track']['album']['name'], 'Unknown Album')
-        self.assertEqual(tracks[0]['track']['album']['images'], [])
-        
-        self.assertIn('external_urls', tracks[0]['track'])
-        self.assertEqual(tracks[0]['track']['external_urls']['spotify'], 'https://open.spotify.com/track/track1')
-
-    def test_get_playlist_tracks_with_fallback(self):
-        """Test getting playlist tracks with fallback for API error."""
-        # Create mock client
-        mock_client = MagicMock()
-        
-        # Make first call fail with exception
-        mock_client.playlist_tracks.side_effect = [
-            Exception("API error with specific fields"),  # First call fails
-            {'items': [{'track': {'id': 'track1', 'name': 'Track 1', 'artists': [{'name': 'Artist 1'}], 'album': {'name': 'Album 1', 'images': []}}}]}  # Second call succeeds
-        ]
-        
-        # Create service with mock client
-        service = SpotifyService(spotify_client=mock_client)
-        
-        # Get tracks
-        tracks = service.get_playlist_tracks('playlist1')
-        
-        # Verify tracks from fallback are returned
-        self.assertEqual(len(tracks), 1)
-        self.assertEqual(tracks[0]['track']['id'], 'track1')
-        
-        # Verify client was called twice - first with specific fields, then with minimal fields
-        self.assertEqual(mock_client.playlist_tracks.call_count, 2)
-        
-        # Check first call
-        first_call_args = mock_client.playlist_tracks.call_args_list[0][0]
-        first_call_kwargs = mock_client.playlist_tracks.call_args_list[0][1]
-        self.assertEqual(first_call_args[0], 'playlist1')
-        self.assertIn('items(track(id,name,uri,duration_ms,artists(id,name),album(id,name,images),external_urls))', first_call_kwargs['fields'])
-        
-        # Check second call (fallback)
-        second_call_args = mock_client.playlist_tracks.call_args_list[1][0]
-        second_call_kwargs = mock_client.playlist_tracks.call_args_list[1][1]
-        self.assertEqual(second_call_args[0], 'playlist1')
-        self.assertEqual(second_call_kwargs['fields'], 'items')
-
-    def test_get_saved_tracks(self):
-        """Test getting user's saved tracks."""
-        # Create mock client
-        mock_client = MagicMock()
-        
-        # Set up mock client to return tracks
-        mock_tracks_response = {
-            'items': [
-                {'track': {'id': 'track1', 'name': 'Track 1'}},
-                {'track': {'id': 'track2', 'name': 'Track 2'}}
-            ],
-            'next': None  # No more pages
+    ]
+}
+
+_MISSING_FIELDS_TRACKS_RESPONSE = {
+    'items': [
+        {
+            'track': {
+                'id': 'track1',
+                'name': 'Track 1',
+                # Missing 'artists' field
+                # Missing 'album' field
+                # Missing 'external_urls' field
+            }
+        },
+        {
+            'track': None  # Track is None
+        },
+        {
+            # Missing 'track' field entirely
         }
-        mock_client.current_user_saved_tracks.return_value = mock_tracks_response
-        
-        # Create service with mock client
-        service = SpotifyService(spotify_client=mock_client)
-        
-        # Get saved tracks
-        tracks = service.get_saved_tracks()
-        
-        # This method is likely a stub and we just need to make sure it doesn't fail
-        # If it's actually implemented, we'd verify the tracks are returned correctly
-        self.assertIsInstance(tracks, list)  # Should return some kind of list
-        
-        # Verify client was called
-        mock_client.current_user_saved_tracks.assert_called()
-
-    def test_add_tracks_to_playlist_no_client(self):
-        """Test adding tracks to playlist with no client."""
-        # Create service with no client
-        service = SpotifyService()
-        
-        # Add tracks
-        result = service.add_tracks_to_playlist('playlist1', ['uri1', 'uri2'])
-        
-        # Verify operation failed
-        self.assertFalse(result)
-        
-    def test_add_tracks_to_playlist_success(self):
-        """Test adding tracks to playlist successfully."""
-        # Create mock client
-        mock_client = MagicMock()
-        
-        # Create service with mock client
-        service = SpotifyService(spotify_client=mock_client)
-        
-        # Add tracks
-        result = service.add_tracks_to_playlist('playlist1', ['uri1', 'uri2'])
-        
-        # Verify operation succeeded
-        self.assertTrue(result)
-        
-        # Verify client was called with correct params
-        mock_client.playlist_add_items.assert_called_once_with('playlist1', ['uri1', 'uri2'])
-        
-    def test_add_tracks_to_playlist_error(self):
-        """Test error handling when adding tracks to playlist."""
-        # Create mock client that raises exception
-        mock_client = MagicMock()
-        mock_client.playlist_add_items.side_effect = Exception("API error")
-        
-        # Create service with mock client
-        service = SpotifyService(spotify_client=mock_client)
-        
-        # Add tracks
-        result = service.add_tracks_to_playlist('playlist1', ['uri1', 'uri2'])
-        
-        # Verify operation failed
-        self.assertFalse(result)
-        
-    def test_get_track_audio_features_no_client(self):
-        """Test getting track audio features with no client."""
-        # Create service with no client
-        service = SpotifyService()
-        
-        # Get audio features
-        features = service.get_track_audio_features('track1')
-        
-        # Verify None is returned
-        self.assertIsNone(features)
-        
-    def test_get_track_audio_features_success(self):
-        """Test getting track audio features successfully."""
-        # Create mock client
-        mock_client = MagicMock()
-        mock_client.audio_features.return_value = [
+    ]
+}
+
+_FALLBACK_TRACKS_RESPONSE = {
+    'items': [{'track': {'id': 'track1', 'name': 'Track 1', 'artists': [{'name': 'Artist 1'}],
+                         'album': {'name': 'Album 1', 'images': []}}}]
+}
+
+_SAVED_TRACKS_RESPONSE = {
+    'items': [
+        {'track': {'id': 'track1', 'name': 'Track 1'}},
+        {'track': {'id': 'track2', 'name': 'Track 2'}}
+    ],
+    'next': None  # No more pages
+}
+
+_AUDIO_FEATURES_RESPONSE = [
+    {
+        "danceability": 0.8,
+        "energy": 0.9,
+        "key": 5,
+        "tempo": 120.5
+    }
+]
+
+# Returned by the service when the API denies access to audio features
+_DEFAULT_AUDIO_FEATURES = {
+    "danceability": 0.5,
+    "energy": 0.5,
+    "acousticness": 0.5,
+    "instrumentalness": 0.5,
+    "liveness": 0.5,
+    "valence": 0.5,
+    "speechiness": 0.5,
+    "tempo": 120
+}
+
+_ARTIST_RESPONSE = {
+    'artists': {
+        'items': [
             {
-                "danceability": 0.8,
-                "energy": 0.9,
-                "key": 5,
-                "tempo": 120.5
+                'id': 'artist1',
+                'name': 'Test Artist',
+                'images': [{'url': 'http://example.com/image1.jpg'}]
             }
         ]
-        
-        # Create service with mock client
-        service = SpotifyService(spotify_client=mock_client)
-        
-        # Get audio features
-        features = service.get_track_audio_features('track1')
-        
-        # Verify features are returned
-        self.assertEqual(features["danceability"], 0.8)
-        self.assertEqual(features["energy"], 0.9)
-        self.assertEqual(features["tempo"], 120.5)
-        
-        # Verify client was called with correct params
-        mock_client.audio_features.assert_called_once_with('track1')
-        
-    def test_get_track_audio_features_empty_response(self):
-        """Test getting track audio features with empty response."""
-        # Create mock client with empty response
-        mock_client = MagicMock()
-        mock_client.audio_features.return_value = []
-        
-        # Create service with mock client
-        service = SpotifyService(spotify_client=mock_client)
-        
-        # Get audio features
-        features = service.get_track_audio_features('track1')
-        
-        # Verify None is returned
-        self.assertIsNone(features)
-        
-    def test_get_track_audio_features_403_error(self):
-        """Test handling 403 error when getting track audio features."""
-        # Create mock client that raises 403 exception
-        mock_client = MagicMock()
-        mock_client.audio_features.side_effect = Exception("403 Forbidden")
-        
-        # Create service with mock client
-        service = SpotifyService(spotify_client=mock_client)
-        
-        # Get audio features
-        features = service.get_track_audio_features('track1')
-        
-        # Verify default features are returned
-        self.assertEqual(features["danceability"], 0.5)
-        self.assertEqual(features["energy"], 0.5)
-        self.assertEqual(features["tempo"], 120)
-        
-    def test_get_track_audio_features_general_error(self):
-        """Test handling general error when getting track audio features."""
-        # Create mock client that raises general exception
-        mock_client = MagicMock()
-        mock_client.audio_features.side_effect = Exception("API error")
-        
-        # Create service with mock client
-        service = SpotifyService(spotify_client=mock_client)
-        
-        # Get audio features
-        features = service.get_track_audio_features('track1')
-        
-        # Verify None is returned
-        self.assertIsNone(features)
-        
-    def test_search_artist_no_client(self):
-        """Test searching for artist with no client."""
-        # Create service with no client
-        service = SpotifyService()
-        
-        # Search for artist
-        artist = service.search_artist("Test Artist")
-        
-        # Verify None is returned
-        self.assertIsNone(artist)
-        
-    def test_search_artist_success(self):
-        """Test searching for artist successfully."""
-        # Create mock client
-        mock_client = MagicMock()
-        mock_client.search.return_value = {
-            'artists': {
-                'items': [
-                    {
-                        'id': 'artist1',
-                        'name': 'Test Artist',
-                        'images': [{'url': 'http://example.com/image1.jpg'}]
-                    }
-                ]
-            }
-        }
-        
-        # Create service with mock client
-        service = SpotifyService(spotify_client=mock_client)
-        
-        # Search for artist
-        artist = service.search_artist("Test Artist")
-        
-        # Verify artist is returned
-        self.assertEqual(artist['id'], 'artist1')
-        self.assertEqual(artist['name'], 'Test Artist')
-        
-        # Verify client was called with correct params
-        mock_client.search.assert_called_once_with(q="artist:Test Artist", type="artist", limit=1)
-        
-    def test_search_artist_no_results(self):
-        """Test searching for artist with no results."""
-        # Create mock client with empty results
-        mock_client = MagicMock()
-        mock_client.search.return_value = {'artists': {'items': []}}
-        
-        # Create service with mock client
-        service = SpotifyService(spotify_client=mock_client)
-        
-        # Search for artist
-        artist = service.search_artist("Test Artist")
-        
-        # Verify None is returned
-        self.assertIsNone(artist)
-        
-    def test_search_artist_missing_images(self):
-        """Test searching for artist with missing images."""
-        # Create mock client with artist missing images
-        mock_client = MagicMock()
-        mock_client.search.return_value = {
-            'artists': {
-                'items': [
-                    {
-                        'id': 'artist1',
-                        'name': 'Test Artist'
-                        # Missing 'images' field
-                    }
-                ]
+    }
+}
+
+_NO_ARTISTS_RESPONSE = {'artists': {'items': []}}
+
+_ARTIST_MISSING_IMAGES_RESPONSE = {
+    'artists': {
+        'items': [
+            {
+                'id': 'artist1',
+                'name': 'Test Artist'
+                # Missing 'images' field
             }
-        }
-        
-        # Create service with mock client
-        service = SpotifyService(spotify_client=mock_client)
-        
-        # Search for artist
-        artist = service.search_artist("Test Artist")
-        
-        # Verify artist is returned with empty images array
-        self.assertEqual(artist['id'], 'artist1')
-        self.assertEqual(artist['name'], 'Test Artist')
-        self.assertEqual(artist['images'], [])
-        
-    def test_search_artist_error(self):
-        """Test error handling when searching for artist."""
-        # Create mock client that raises exception
-        mock_client = MagicMock()
-        mock_client.search.side_effect = Exception("API error")
-        
-        # Create service with mock client
-        service = SpotifyService(spotify_client=mock_client)
-        
-        # Search for artist
-        artist = service.search_artist("Test Artist")
-        
-        # Verify None is returned
-        self.assertIsNone(artist)
+        ]
+    }
+}
+
+
+@pytest.fixture(scope="module")
+def _client_template():
+    """Build the Spotify client mock once for the whole module."""
+    template = MagicMock(spec_set=_CLIENT_METHODS)
+    # Create the client methods up front; reset_mock keeps children, so
+    # they are allocated once rather than on first access in each test
+    for method in _CLIENT_METHODS:
+        getattr(template, method)
+    return template
+
+
+@pytest.fixture
+def mock_client(_client_template):
+    """Reset the shared client mock so no configuration leaks between tests."""
+    _client_template.reset_mock(return_value=True, side_effect=True)
+    return _client_template
+
+
+@pytest.fixture(scope="module")
+def _shared_service(_client_template):
+    """Build one service bound to the client template for the read-only tests."""
+    return SpotifyService(spotify_client=_client_template)
+
+
+@pytest.fixture
+def authed_service(_shared_service, mock_client):
+    """Shared service re-bound to this test's reset client mock."""
+    _shared_service.client = mock_client
+    return _shared_service
+
+
+@pytest.fixture(scope="module")
+def _auth_templates():
+    """Swap spotipy.Spotify and SpotifyOAuth once for the whole module."""
+    templates = SimpleNamespace(spotify=MagicMock(), oauth=MagicMock())
+    with patch.multiple(spotify_service, spotipy=SimpleNamespace(Spotify=templates.spotify),
+                        SpotifyOAuth=templates.oauth):
+        yield templates
+
+
+@pytest.fixture
+def auth_factories(_auth_templates):
+    """Reset the swapped Spotify and SpotifyOAuth factories before each test."""
+    _auth_templates.spotify.reset_mock(return_value=True, side_effect=True)
+    _auth_templates.oauth.reset_mock(return_value=True, side_effect=True)
+    return _auth_templates
+
+
+def test_init():
+    """Test service initialization with and without a client."""
+    assert SpotifyService().client is None
+    client = object()
+    assert SpotifyService(spotify_client=client).client is client
+
+
+@pytest.mark.parametrize("method, args, expected", [
+    pytest.param('get_user_playlists', (), [], id="get_user_playlists"),
+    pytest.param('get_playlist_tracks', ('playlist1',), [], id="get_playlist_tracks"),
+    pytest.param('add_tracks_to_playlist', ('playlist1', ['uri1', 'uri2']), False, id="add_tracks_to_playlist"),
+    pytest.param('get_track_audio_features', ('track1',), None, id="get_track_audio_features"),
+    pytest.param('search_artist', ("Test Artist",), None, id="search_artist"),
+])
+def test_no_client(method, args, expected):
+    """Test each API method returns its empty result when there is no client."""
+    assert getattr(SpotifyService(), method)(*args) == expected
+
+
+def test_authenticate_success(auth_factories):
+    """Test successful authentication."""
+    # Set up mocks
+    mock_spotify = auth_factories.spotify
+    mock_spotify_oauth = auth_factories.oauth
+    mock_spotify_instance = mock_spotify.return_value
+    mock_auth_manager = mock_spotify_oauth.return_value
+
+    # Create service
+    service = SpotifyService()
+
+    # Test authentication
+    result = service.authenticate(
+        client_id=_CLIENT_ID,
+        client_secret=_CLIENT_SECRET,
+        redirect_uri=_REDIRECT_URI
+    )
+
+    # Verify authentication
+    assert result is True
+    mock_spotify_oauth.assert_called_once_with(
+        client_id=_CLIENT_ID,
+        client_secret=_CLIENT_SECRET,
+        redirect_uri=_REDIRECT_URI,
+        scope=SCOPE
+    )
+    mock_spotify.assert_called_once_with(auth_manager=mock_auth_manager)
+    mock_spotify_instance.current_user.assert_called_once()
+    assert service.client == mock_spotify_instance
+
+
+def test_authenticate_failure(auth_factories):
+    """Test authentication failure."""
+    # Set up mocks
+    mock_spotify_instance = auth_factories.spotify.return_value
+    mock_spotify_instance.current_user.side_effect = _api_error()
+
+    # Create service
+    service = SpotifyService()
+
+    # Test authentication
+    result = service.authenticate(
+        client_id=_CLIENT_ID,
+        client_secret=_CLIENT_SECRET,
+        redirect_uri=_REDIRECT_URI
+    )
+
+    # Verify authentication failed
+    assert result is False
+
+
+def test_get_user_playlists_success(mock_client, authed_service):
+    """Test getting playlists successfully."""
+    # The service fills in the empty images in place, so hand out a copy
+    mock_client.current_user_playlists.return_value = copy.deepcopy(_PLAYLISTS_RESPONSE)
+
+    # Get playlists
+    playlists = authed_service.get_user_playlists(limit=10, offset=0)
+
+    # Verify playlists are returned with the missing images filled in
+    assert playlists == _EXPECTED_PLAYLISTS
+
+    # Verify client was called with correct params
+    mock_client.current_user_playlists.assert_called_once_with(limit=10, offset=0)
+
+
+def test_get_user_playlists_with_missing_tracks():
+    """Test getting playlists with missing tracks field."""
+    # Create client double; the service fills in missing fields, so hand out a copy
+    mock_client = SimpleNamespace(
+        current_user_playlists=lambda limit, offset: copy.deepcopy(_MISSING_TRACKS_RESPONSE))
+
+    # Create service with mock client
+    service = SpotifyService(spotify_client=mock_client)
+
+    # Get playlists
+    playlists = service.get_user_playlists()
+
+    # Verify tracks field was added
+    assert playlists == [{**_MISSING_TRACKS_RESPONSE['items'][0], 'tracks': {'total': 0}}]
+
+
+def test_iter_user_playlists(mock_client, authed_service):
+    """Test iterating over playlists page by page."""
+    # Have the client return a full page followed by a short page
+    # The service fills in the empty images in place, so hand out a copy
+    mock_client.current_user_playlists.side_effect = copy.deepcopy(_PLAYLIST_PAGES)
+
+    # Iterate over pages
+    pages = list(authed_service.iter_user_playlists(page_size=2))
+
+    # Verify both pages are returned and iteration stops after the short page
+    assert [[p['id'] for p in page] for page in pages] == [['playlist1', 'playlist2'], ['playlist3']]
+    assert mock_client.current_user_playlists.call_count == 2
+    mock_client.current_user_playlists.assert_called_with(limit=2, offset=2)
+
+
+def test_iter_user_playlists_page_error(mock_client, authed_service):
+    """Test that a failed page is raised rather than treated as the end of the list."""
+    # Have the client return a full page and then fail
+    mock_client.current_user_playlists.side_effect = [copy.deepcopy(_PLAYLIST_PAGES[0]), Exception("API error")]
+
+    pages = authed_service.iter_user_playlists(page_size=2)
+
+    # Verify the first page is still yielded before the error surfaces
+    assert [p['id'] for p in next(pages)] == ['playlist1', 'playlist2']
+    with pytest.raises(Exception, match="API error"):
+        next(pages)
+
+
+def test_iter_user_playlists_no_client():
+    """Test iterating over playlists with no client."""
+    # Create service with no client
+    service = SpotifyService()
+
+    # Verify no pages are returned
+    assert list(service.iter_user_playlists()) == []
+
+
+def test_get_playlist_tracks_success(mock_client, authed_service):
+    """Test getting playlist tracks successfully."""
+    mock_client.playlist_tracks.return_value = _TRACKS_RESPONSE
+
+    # Get tracks
+    tracks = authed_service.get_playlist_tracks('playlist1', limit=50, offset=0)
+
+    # Verify tracks are returned unchanged
+    assert tracks == _TRACKS_RESPONSE['items']
+
+    # Verify client was called with correct params
+    mock_client.playlist_tracks.assert_called_once_with(
+        'playlist1',
+        limit=50,
+        offset=0,
+        fields='items(track(id,name,uri,duration_ms,artists(id,name),album(id,name,images),external_urls))'
+    )
+
+
+@pytest.mark.parametrize("client_method, fetch", [
+    pytest.param('current_user_playlists', lambda service: service.get_user_playlists(), id="playlists"),
+    pytest.param('playlist_tracks', lambda service: service.get_playlist_tracks('playlist1'), id="playlist-tracks"),
+])
+def test_fetch_error_returns_empty_list(mock_client, authed_service, client_method, fetch):
+    """Test error handling when getting playlists or playlist tracks."""
+    # Make the client method raise
+    getattr(mock_client, client_method).side_effect = _api_error()
+
+    # Verify empty list is returned on error
+    assert fetch(authed_service) == []
+
+
+def test_get_playlist_tracks_with_missing_fields():
+    """Test getting playlist tracks with missing fields."""
+    # Create client double with incomplete track data
+    mock_client = SimpleNamespace(
+        playlist_tracks=lambda playlist_id, limit, offset, fields: copy.deepcopy(_MISSING_FIELDS_TRACKS_RESPONSE))
+
+    # Create service with mock client
+    service = SpotifyService(spotify_client=mock_client)
+
+    # Get tracks
+    tracks = service.get_playlist_tracks('playlist1')
+
+    # Verify valid tracks are returned and invalid ones filtered out
+    assert len(tracks) == 1
+
+    # Verify fields were added
+    assert 'artists' in tracks[0]['track']
+    assert tracks[0]['track']['artists'] == []
+
+    assert 'album' in tracks[0]['track']
+    assert tracks[0]['track']['album']['name'] == 'Unknown Album'
+    assert tracks[0]['track']['album']['images'] == []
+
+    assert 'external_urls' in tracks[0]['track']
+    assert tracks[0]['track']['external_urls']['spotify'] == 'https://open.spotify.com/track/track1'
+
+
+def test_get_playlist_tracks_with_fallback(mock_client, authed_service):
+    """Test getting playlist tracks with fallback for API error."""
+    # Make first call fail with exception
+    mock_client.playlist_tracks.side_effect = [
+        _api_error(),  # First call fails
+        copy.deepcopy(_FALLBACK_TRACKS_RESPONSE)  # Second call succeeds; external_urls gets filled in
+    ]
+
+    # Get tracks
+    tracks = authed_service.get_playlist_tracks('playlist1')
+
+    # Verify tracks from fallback are returned
+    assert len(tracks) == 1
+    assert tracks[0]['track']['id'] == 'track1'
+
+    # Verify client was called twice - first with specific fields, then with minimal fields
+    assert mock_client.playlist_tracks.call_count == 2
+
+    # Check first call
+    first_call_args = mock_client.playlist_tracks.call_args_list[0][0]
+    first_call_kwargs = mock_client.playlist_tracks.call_args_list[0][1]
+    assert first_call_args[0] == 'playlist1'
+    assert 'items(track(id,name,uri,duration_ms,artists(id,name),album(id,name,images),external_urls))' in first_call_kwargs['fields']
+
+    # Check second call (fallback)
+    second_call_args = mock_client.playlist_tracks.call_args_list[1][0]
+    second_call_kwargs = mock_client.playlist_tracks.call_args_list[1][1]
+    assert second_call_args[0] == 'playlist1'
+    assert second_call_kwargs['fields'] == 'items'
+
+
+def test_get_saved_tracks(mock_client, authed_service):
+    """Test getting user's saved tracks."""
+    # Set up mock client to return tracks
+    mock_client.current_user_saved_tracks.return_value = _SAVED_TRACKS_RESPONSE
+
+    # Get saved tracks
+    tracks = authed_service.get_saved_tracks()
+
+    # This method is likely a stub and we just need to make sure it doesn't fail
+    # If it's actually implemented, we'd verify the tracks are returned correctly
+    assert isinstance(tracks, list)  # Should return some kind of list
+
+    # Verify client was called
+    mock_client.current_user_saved_tracks.assert_called()
+
+
+def test_add_tracks_to_playlist_success(mock_client, authed_service):
+    """Test adding tracks to playlist successfully."""
+    # Add tracks
+    result = authed_service.add_tracks_to_playlist('playlist1', ['uri1', 'uri2'])
+
+    # Verify operation succeeded
+    assert result is True
+
+    # Verify client was called with correct params
+    mock_client.playlist_add_items.assert_called_once_with('playlist1', ['uri1', 'uri2'])
+
+
+def test_add_tracks_to_playlist_error(mock_client, authed_service):
+    """Test error handling when adding tracks to playlist."""
+    # Make the client raise an exception
+    mock_client.playlist_add_items.side_effect = _api_error()
+
+    # Add tracks
+    result = authed_service.add_tracks_to_playlist('playlist1', ['uri1', 'uri2'])
+
+    # Verify operation failed
+    assert result is False
+
+
+@pytest.mark.parametrize("mock_attr, mock_value, expected", [
+    pytest.param('return_value', _AUDIO_FEATURES_RESPONSE, _AUDIO_FEATURES_RESPONSE[0], id="success"),
+    pytest.param('return_value', [], None, id="empty-response"),
+    pytest.param('side_effect', _forbidden_error, _DEFAULT_AUDIO_FEATURES, id="403-error"),
+    pytest.param('side_effect', _api_error, None, id="general-error"),
+])
+def test_get_track_audio_features(mock_client, authed_service, mock_attr, mock_value, expected):
+    """Test audio feature lookups for the different API responses and errors."""
+    if mock_attr == 'side_effect':
+        mock_value = mock_value()
+    setattr(mock_client.audio_features, mock_attr, mock_value)
+
+    assert authed_service.get_track_audio_features('track1') == expected
+    mock_client.audio_features.assert_called_once_with('track1')
+
+
+@pytest.mark.parametrize("mock_attr, mock_value, expected", [
+    pytest.param('return_value', _ARTIST_RESPONSE, _ARTIST_RESPONSE['artists']['items'][0], id="success"),
+    pytest.param('return_value', _NO_ARTISTS_RESPONSE, None, id="no-results"),
+    pytest.param('return_value', _ARTIST_MISSING_IMAGES_RESPONSE,
+                 {'id': 'artist1', 'name': 'Test Artist', 'images': []}, id="missing-images"),
+    pytest.param('side_effect', _api_error, None, id="error"),
+])
+def test_search_artist(mock_client, authed_service, mock_attr, mock_value, expected):
+    """Test artist search for the different API responses and errors."""
+    if mock_attr == 'side_effect':
+        mock_value = mock_value()
+    else:
+        # The service fills in missing images in place, so hand each run its own copy
+        mock_value = copy.deepcopy(mock_value)
+    setattr(mock_client.search, mock_attr, mock_value)
+
+    assert authed_service.search_artist("Test Artist") == expected
+    mock_client.search.assert_called_once_with(q="artist:Test Artist", type="artist", limit=1)
 
 
 if __name__ == '__main__':
-    unittest.main() 
\ No newline at end of file
+    raise SystemExit(pytest.main([__file__]))
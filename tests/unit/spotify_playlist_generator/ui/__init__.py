@@ -0,0 +1,3 @@
+"""
+Unit tests for ui package.
+"""
\ No newline at end of file
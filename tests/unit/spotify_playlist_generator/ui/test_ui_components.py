@@ -0,0 +1,170 @@
+"""
+Unit tests for the view and track list helpers in ui_components.
+"""
+from types import MappingProxyType, SimpleNamespace
+from unittest.mock import MagicMock, patch
+from weakref import WeakKeyDictionary
+
+import pytest
+
+from src.spotify_playlist_generator.ui import ui_components
+from src.spotify_playlist_generator.ui.ui_components import (
+    PlaylistComponents,
+    _dispatch_track_click,
+    _playlist_view,
+    _track_html,
+    _track_view,
+)
+
+_TRACK = MappingProxyType({
+    'track': {
+        'id': 'track1',
+        'name': 'Rock & <Roll>',
+        'artists': [{'name': 'AC"DC'}, {'name': 'Guns \'N\' Roses'}],
+        'album': {'name': 'Best <Of>', 'images': [{'url': 'https://example.com/a.jpg?x=1&y=2'}]},
+        'external_urls': {'spotify': 'https://open.spotify.com/track/track1?si="x"'},
+    }
+})
+
+_TRACKS = (
+    MappingProxyType({'track': {'id': 'track1', 'name': 'Track 1'}}),
+    MappingProxyType({'track': {'id': 'track2', 'name': 'Track 2'}}),
+    MappingProxyType({'track': {'id': 'track3', 'name': 'Track 3'}}),
+)
+
+
+@pytest.fixture
+def detail_ui():
+    """Record the ui.html content and page event handlers the playlist detail view creates."""
+    html, on = MagicMock(), MagicMock()
+    with patch.object(ui_components.ui, 'html', html), patch.object(ui_components.ui, 'on', on), \
+            patch.object(ui_components, '_TRACK_CLICK_TARGETS', WeakKeyDictionary()):
+        yield SimpleNamespace(html=html, on=on)
+
+
+def test_playlist_view(sample_playlist):
+    """Test extracting the rendered fields from a complete playlist."""
+    view = _playlist_view(sample_playlist)
+
+    assert view == ('Test Playlist', 'Test Description', 10, 'Test User', 'http://example.com/image.jpg',
+                    'test123', False, True, True)
+
+
+def test_playlist_view_no_image(sample_playlist_no_image):
+    """Test that a playlist without images has no image URL and is not marked private."""
+    view = _playlist_view(sample_playlist_no_image)
+
+    assert view.image_url is None
+    assert (view.is_public, view.is_private) == (True, False)
+    assert (view.name, view.total_tracks) == ('Test Playlist No Image', 5)
+
+
+@pytest.mark.parametrize("change", [
+    pytest.param({'name': 'Renamed'}, id="name"),
+    pytest.param({'description': 'New description'}, id="description"),
+    pytest.param({'images': [{'url': 'http://example.com/new.jpg'}]}, id="image"),
+    pytest.param({'tracks': {'total': 11}}, id="track-total"),
+    pytest.param({'owner': {'display_name': 'New Owner'}}, id="owner"),
+    pytest.param({'public': True}, id="visibility"),
+])
+def test_playlist_render_key_tracks_displayed_fields(sample_playlist, change):
+    """Test that changing any displayed field changes the render key, even without a new snapshot."""
+    key = PlaylistComponents.playlist_render_key(sample_playlist)
+
+    assert PlaylistComponents.playlist_render_key(dict(sample_playlist)) == key
+    assert PlaylistComponents.playlist_render_key({**sample_playlist, **change}) != key
+
+
+def test_track_html_escapes_fields():
+    """Test that track names, artists, album and URLs are HTML-escaped."""
+    html = _track_html(0, _TRACK)
+
+    assert 'Rock &amp; &lt;Roll&gt;' in html
+    assert 'AC&quot;DC, Guns &#x27;N&#x27; Roses • Best &lt;Of&gt;' in html
+    assert 'src="https://example.com/a.jpg?x=1&amp;y=2"' in html
+    assert 'href="https://open.spotify.com/track/track1?si=&quot;x&quot;"' in html
+    assert '<Roll>' not in html and '<Of>' not in html
+
+
+@pytest.mark.parametrize("index, click_event, expected", [
+    pytest.param(3, 'track_click_abc', ' onclick="emitEvent(\'track_click_abc\', 3)"', id="with-event"),
+    pytest.param(3, None, 'class="q-card w-full p-2 hover:bg-gray-50 cursor-pointer">', id="no-event"),
+])
+def test_track_html_click_event(index, click_event, expected):
+    """Test that the row emits its index with the click event only when one is given."""
+    html = _track_html(index, _TRACK, click_event)
+
+    assert expected in html
+    assert ('emitEvent' in html) is (click_event is not None)
+
+
+@pytest.mark.parametrize("track_data", [
+    pytest.param(None, id="none"),
+    pytest.param({}, id="empty"),
+    pytest.param({'track': None}, id="null-track"),
+])
+def test_track_html_no_track(track_data):
+    """Test that items without a track render nothing."""
+    assert _track_html(0, track_data) == ''
+
+
+def test_track_view_null_album_and_artists():
+    """Test that null album and artists fall back to placeholders instead of raising."""
+    view = _track_view({'id': 'track1', 'name': None, 'artists': None, 'album': None})
+
+    assert view == ('Unknown Track', 'Unknown Artist', 'Unknown Album', None,
+                    'https://open.spotify.com/track/track1')
+
+
+def test_track_html_skips_malformed_row():
+    """Test that a malformed track yields an empty row instead of raising."""
+    assert _track_html(0, {'track': {'album': {'images': [None]}}}) == ''
+
+
+@pytest.mark.parametrize("args, expected_index", [
+    pytest.param([2], 2, id="list-args"),
+    pytest.param(1, 1, id="scalar-args"),
+    pytest.param('0', 0, id="string-args"),
+])
+def test_dispatch_track_click(args, expected_index):
+    """Test that the clicked row index maps back to the matching track."""
+    clicked = []
+
+    _dispatch_track_click(clicked.append, _TRACKS, SimpleNamespace(args=args))
+
+    assert clicked == [_TRACKS[expected_index]]
+
+
+def _track_click_handlers(on):
+    """Handlers registered for the track list page event, ignoring element .on calls on the shared stub."""
+    return [c.args[1] for c in on.call_args_list if c.args[0] == 'track_click_test123']
+
+
+def test_playlist_detail_track_rows_keep_click_handlers(detail_ui, sample_playlist):
+    """Test that the track list markup sent to ui.html keeps the inline row and play link handlers."""
+    PlaylistComponents.render_playlist_detail(sample_playlist, tracks=list(_TRACKS), on_track_click=print)
+
+    (content,), kwargs = detail_ui.html.call_args
+    for index in range(len(_TRACKS)):
+        assert f'onclick="emitEvent(\'track_click_test123\', {index})"' in content
+    assert content.count('onclick="event.stopPropagation()"') == len(_TRACKS)
+    # Nothing asks NiceGUI to sanitize the (already escaped) markup
+    assert 'sanitize' not in kwargs
+    assert _track_click_handlers(detail_ui.on)
+
+
+def test_playlist_detail_registers_track_click_once(detail_ui, sample_playlist):
+    """Test that re-rendering a playlist reuses one page handler bound to the latest tracks."""
+    clicked = []
+    PlaylistComponents.render_playlist_detail(sample_playlist, tracks=list(_TRACKS), on_track_click=print)
+    PlaylistComponents.render_playlist_detail(sample_playlist, tracks=list(_TRACKS[::-1]),
+                                              on_track_click=clicked.append)
+
+    handlers = _track_click_handlers(detail_ui.on)
+    assert len(handlers) == 1
+    handlers[0](SimpleNamespace(args=[0]))
+    assert clicked == [_TRACKS[-1]]
+
+
+if __name__ == '__main__':
+    raise SystemExit(pytest.main([__file__]))
@@ -1,12 +1,15 @@
 """
 Unit tests for the utils module.
 """
+import os
 import unittest
+from types import MappingProxyType
 from unittest.mock import patch
 
 from src.spotify_playlist_generator.utils import (
     format_playlist_name,
     validate_spotify_uri,
+    validate_spotify_uris,
     truncate_description,
     filter_playlists_by_owner,
     get_env_var
@@ -16,71 +19,114 @@ from src.spotify_playlist_generator.utils import (
 class TestUtils(unittest.TestCase):
     """Test cases for the utils module."""
 
+    # (name, expected) pairs for format_playlist_name
+    FORMAT_CASES = (
+        # Special characters are removed
+        ("My Playlist!@#$%^&*()", "My Playlist"),
+        # Surrounding whitespace is stripped
+        ("  My Playlist  ", "My Playlist"),
+        # Long names are truncated
+        ("This is a very long playlist name that should be truncated because it exceeds the limit",
+         "This is a very long playlist name that should b..."),
+        ("", ""),
+        # Only special characters
+        ("!@#$%^&*()", ""),
+    )
+
+    VALID_URIS = (
+        "spotify:track:1Uj0QobxhxpJQjjJbPNaIJ",
+        "spotify:album:5HRPZQnY2Z18nvMmcyOvUy",
+        "spotify:artist:1snhtMLeb2DYoMOcVbb8iB",
+        "spotify:playlist:37i9dQZF1DWWGFQLoP9qlv",
+    )
+
+    INVALID_URIS = (
+        "spotify:track:invalid_id",
+        "spotify:unknown:1Uj0QobxhxpJQjjJbPNaIJ",
+        "not_a_spotify_uri",
+        "",
+        # Correct format but not enough characters
+        "spotify:track:1Uj0QobxhxpJQjjJbPNaI",
+        # Correct format but too many characters
+        "spotify:track:1Uj0QobxhxpJQjjJbPNaIJK",
+        # Non-ASCII alphanumerics and extra separators are rejected
+        "spotify:track:1Uj0QobxhxpJQjjJbPNaIé",
+        "spotify:track:1Uj0Qobx:xpJQjjJbPNaIJ",
+    )
+
+    # (args, expected) pairs for truncate_description
+    TRUNCATE_CASES = (
+        # Short description (no truncation needed)
+        (("This is a short description",), "This is a short description"),
+        # Long description (needs truncation)
+        (("This is a very long description that exceeds the default maximum length of 100 characters and should be truncated with ellipsis.",),
+         "This is a very long description that exceeds the default maximum length of 100 characters and sho..."),
+        (("",), ""),
+        ((None,), ""),
+        # Custom max length
+        (("This is a test description", 10), "This is..."),
+    )
+
+    @classmethod
+    def setUpClass(cls):
+        """Build the read-only sample playlists once for the whole class."""
+        cls.PLAYLISTS = tuple(
+            MappingProxyType({"name": name, "owner": {"id": owner_id, "display_name": display_name}})
+            for name, owner_id, display_name in (
+                ("Playlist 1", "user1", "User 1"),
+                ("Playlist 2", "user2", "User 2"),
+                ("Playlist 3", "user1", "User 1"),
+                ("Playlist 4", "user3", "User 3"),
+            )
+        )
+
     def test_format_playlist_name(self):
         """Test formatting playlist names."""
-        # Test removing special characters
-        self.assertEqual(format_playlist_name("My Playlist!@#$%^&*()"), "My Playlist")
-        
-        # Test stripping whitespace
-        self.assertEqual(format_playlist_name("  My Playlist  "), "My Playlist")
-        
-        # Test truncating long names
-        long_name = "This is a very long playlist name that should be truncated because it exceeds the limit"
-        self.assertEqual(format_playlist_name(long_name), "This is a very long playlist name that should b...")
-        
-        # Test empty name
-        self.assertEqual(format_playlist_name(""), "")
-        
-        # Test name with only special characters
-        self.assertEqual(format_playlist_name("!@#$%^&*()"), "")
+        for name, expected in self.FORMAT_CASES:
+            with self.subTest(name=name):
+                self.assertEqual(format_playlist_name(name), expected)
 
     def test_validate_spotify_uri(self):
         """Test validating Spotify URIs."""
-        # Valid URIs
-        self.assertTrue(validate_spotify_uri("spotify:track:1Uj0QobxhxpJQjjJbPNaIJ"))
-        self.assertTrue(validate_spotify_uri("spotify:album:5HRPZQnY2Z18nvMmcyOvUy"))
-        self.assertTrue(validate_spotify_uri("spotify:artist:1snhtMLeb2DYoMOcVbb8iB"))
-        self.assertTrue(validate_spotify_uri("spotify:playlist:37i9dQZF1DWWGFQLoP9qlv"))
-        
-        # Invalid URIs
-        self.assertFalse(validate_spotify_uri("spotify:track:invalid_id"))
-        self.assertFalse(validate_spotify_uri("spotify:unknown:1Uj0QobxhxpJQjjJbPNaIJ"))
-        self.assertFalse(validate_spotify_uri("not_a_spotify_uri"))
-        self.assertFalse(validate_spotify_uri(""))
-        
-        # URI with correct format but not enough characters
-        self.assertFalse(validate_spotify_uri("spotify:track:1Uj0QobxhxpJQjjJbPNaI"))
-        
-        # URI with correct format but too many characters
-        self.assertFalse(validate_spotify_uri("spotify:track:1Uj0QobxhxpJQjjJbPNaIJK"))
+        for uri in self.VALID_URIS:
+            with self.subTest(uri=uri):
+                self.assertTrue(validate_spotify_uri(uri))
+        for uri in self.INVALID_URIS:
+            with self.subTest(uri=uri):
+                self.assertFalse(validate_spotify_uri(uri))
+
+    def test_validate_spotify_uris(self):
+        """Test validating a batch of Spotify URIs."""
+        uris = [
+            "spotify:track:1Uj0QobxhxpJQjjJbPNaIJ",
+            "spotify:track:invalid_id",
+            "spotify:playlist:37i9dQZF1DWWGFQLoP9qlv",
+            "",
+        ]
+        self.assertEqual(validate_spotify_uris(uris), [True, False, True, False])
+        
+        # Empty batch
+        self.assertEqual(validate_spotify_uris([]), [])
+        
+        # Batch results agree with the single-URI check on edge cases
+        edge_cases = [
+            "spotify:show:1Uj0QobxhxpJQjjJbPNaIJ",
+            "spotify:track:1Uj0QobxhxpJQjjJbPNaI\u00e9",
+            "spotify:track:1Uj0QobxhxpJQjjJbPNaIJ\n",
+            "spotify:track:1Uj0Qobx:xpJQjjJbPNaIJ",
+            "spotify:track:spotify:track:1Uj0QobxhxpJQjjJbPNaIJ",
+        ]
+        self.assertEqual(validate_spotify_uris(edge_cases), [validate_spotify_uri(uri) for uri in edge_cases])
 
     def test_truncate_description(self):
         """Test truncating descriptions."""
-        # Short description (no truncation needed)
-        self.assertEqual(truncate_description("This is a short description"), "This is a short description")
-        
-        # Long description (needs truncation)
-        long_desc = "This is a very long description that exceeds the default maximum length of 100 characters and should be truncated with ellipsis."
-        self.assertEqual(truncate_description(long_desc), "This is a very long description that exceeds the default maximum length of 100 characters and sho...")
-        
-        # Empty description
-        self.assertEqual(truncate_description(""), "")
-        
-        # None description
-        self.assertEqual(truncate_description(None), "")
-        
-        # Custom max length
-        self.assertEqual(truncate_description("This is a test description", 10), "This is...")
+        for args, expected in self.TRUNCATE_CASES:
+            with self.subTest(args=args):
+                self.assertEqual(truncate_description(*args), expected)
 
     def test_filter_playlists_by_owner(self):
         """Test filtering playlists by owner."""
-        # Sample playlist data
-        playlists = [
-            {"name": "Playlist 1", "owner": {"id": "user1", "display_name": "User 1"}},
-            {"name": "Playlist 2", "owner": {"id": "user2", "display_name": "User 2"}},
-            {"name": "Playlist 3", "owner": {"id": "user1", "display_name": "User 1"}},
-            {"name": "Playlist 4", "owner": {"id": "user3", "display_name": "User 3"}},
-        ]
+        playlists = self.PLAYLISTS
         
         # Filter by user1
         user1_playlists = filter_playlists_by_owner(playlists, "user1")
@@ -110,14 +156,9 @@ class TestUtils(unittest.TestCase):
         self.assertEqual(len(filtered_malformed), 1)
         self.assertEqual(filtered_malformed[0]["name"], "Correct Playlist")
 
-    @patch('os.environ')
-    def test_get_env_var(self, mock_environ):
+    @patch.dict(os.environ, {'EXISTING_VAR': 'value'}, clear=True)
+    def test_get_env_var(self):
         """Test getting environment variables."""
-        # Set up mock environment variable
-        mock_environ.get.side_effect = lambda key, default=None: {
-            'EXISTING_VAR': 'value',
-        }.get(key, default)
-        
         # Test getting existing variable
         self.assertEqual(get_env_var('EXISTING_VAR'), 'value')
         
@@ -126,6 +167,9 @@ class TestUtils(unittest.TestCase):
         
         # Test getting non-existent variable without default
         self.assertIsNone(get_env_var('NON_EXISTENT_VAR'))
+        
+        # Test keyword arguments
+        self.assertEqual(get_env_var(name='NON_EXISTENT_VAR', default='default_value'), 'default_value')
 
 
 if __name__ == '__main__':